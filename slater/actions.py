@@ -1,3 +1,4 @@
+import copy
 from pathlib import Path
 
 from actionpack import Action
@@ -39,10 +40,15 @@ class SlaterAction(Action):
 
     def _clone(self) -> "SlaterAction":
         """
-        Subclasses may override if they have config.
+        Shallow-copy this template, carrying over its config attributes
+        but not any bound state or context.
+
+        Subclasses need only override if their config must not be shared.
         """
-        clone = type(self)()
-        clone.name = self.name or str(self.__class__.__name__)
+        clone = copy.copy(self)
+        clone.__dict__.pop("_state", None)
+        clone.__dict__.pop("_ctx", None)
+        clone.name = self.name or self.__class__.__name__
         return clone
 
     def materialize(
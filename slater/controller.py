@@ -155,8 +155,7 @@ class AgentController:
             )
 
             # 🔑 FROM HERE ON, USE DURABLE STATE ONLY
-            durable_facts = iteration_state.persistent_facts()
-            durable_keys = set(durable_facts.serialize().keys())
+            durable_keys = iteration_state.persistent_keys()
 
             # ---- 1. ControlPolicy (global overrides) ----
 
@@ -191,7 +190,8 @@ class AgentController:
                 f"Agent exceeded max iterations ({max_iterations})"
             )
 
-    def _detect_cycle(self, phase_history: list[Enum], max_same_phase: int) -> bool:
+    @staticmethod
+    def _detect_cycle(phase_history: list[Enum], max_same_phase: int) -> bool:
         """
         Detect if agent is stuck in the same phase.
 
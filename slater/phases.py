@@ -1,6 +1,8 @@
 import re
+import sys
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from functools import lru_cache
 from typing import AbstractSet, FrozenSet, List, Set, Type
 
 
@@ -24,13 +26,14 @@ class PhaseEnum:
         phase.value  # 1
     """
 
-    # Validation pattern
-    _NAME_PATTERN = re.compile(r"^[A-Z][A-Z0-9_]*$")
+    # Validation pattern (compiled once; applied with fullmatch)
+    _NAME_PATTERN = re.compile(r"[A-Z][A-Z0-9_]*")
 
     # Reserved names
     _RESERVED: FrozenSet[str] = frozenset(
         {"NONE", "ANY", "ALL", "DEFAULT", "UNKNOWN", "TRUE", "FALSE", "NULL"}
     )
+    _RESERVED_LISTING = ", ".join(sorted(_RESERVED))
 
     @classmethod
     def create(cls, *names: str, class_name: str = "Phase") -> Type[Enum]:
@@ -42,7 +45,9 @@ class PhaseEnum:
             class_name: Name for the generated enum class
 
         Returns:
-            A new Enum class with the given phases
+            An Enum class with the given phases. Recent identical calls may
+            share a cached class; this is a performance detail, so create the
+            enum once and import it rather than relying on class identity.
 
         Raises:
             ValueError: If names are invalid, reserved, or duplicated
@@ -52,7 +57,16 @@ class PhaseEnum:
             assert Phase.START.name == "START"
         """
         cls._validate(names)
-        return Enum(class_name, {name: auto() for name in names})
+        # interned: member names double as dict/set keys in specs and logs
+        return cls._build(tuple(map(sys.intern, names)), class_name)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _build(names: tuple[str, ...], class_name: str) -> Type[Enum]:
+        """Construct the Enum class (bounded memo; EnumMeta creation is costly)."""
+        # explicit (name, value) pairs: same values as auto(), without
+        # routing each member through _generate_next_value_
+        return Enum(class_name, [(name, value) for value, name in enumerate(names, start=1)])
 
     @classmethod
     def from_list(cls, names: List[str], class_name: str = "Phase") -> Type[Enum]:
@@ -88,6 +102,7 @@ class PhaseEnum:
 
         seen: Set[str] = set()
         errors: List[str] = []
+        is_well_formed = cls._NAME_PATTERN.fullmatch
 
         for name in names:
             # Type check
@@ -98,7 +113,7 @@ class PhaseEnum:
                 continue
 
             # Format check
-            if not cls._NAME_PATTERN.match(name):
+            if not is_well_formed(name):
                 errors.append(
                     f"Invalid phase name: '{name}' "
                     f"(must be UPPER_SNAKE_CASE, e.g., 'READY_TO_CONTINUE')"
@@ -109,7 +124,7 @@ class PhaseEnum:
             if name in cls._RESERVED:
                 errors.append(
                     f"Reserved phase name: '{name}' "
-                    f"(cannot use: {', '.join(sorted(cls._RESERVED))})"
+                    f"(cannot use: {cls._RESERVED_LISTING})"
                 )
                 continue
 
@@ -137,7 +152,17 @@ class PhaseEnum:
                 Phase = PhaseEnum.from_list(["START", "DONE"])
         """
         try:
-            cls._validate(tuple(names))
+            return cls._is_valid(tuple(names))
+        except TypeError:
+            # unhashable entries can't key the cache (and aren't strings)
+            return False
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _is_valid(cls, names: tuple[str, ...]) -> bool:
+        """Memoized validation result (validation is pure in names)."""
+        try:
+            cls._validate(names)
             return True
         except ValueError:
             return False
@@ -155,10 +180,13 @@ class Phase(Enum):
     TERMINAL_FAILURE = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PhaseRule:
     """
     Declarative rule for entering a Phase based on durable Facts.
+
+    Conditions may be given as any iterable of keys; they are stored
+    as frozensets so matches() never converts or allocates per call.
     """
 
     enter: Enum  # Phase enum member
@@ -167,17 +195,23 @@ class PhaseRule:
     when_any: FrozenSet[str] = field(default_factory=frozenset)
     when_none: FrozenSet[str] = field(default_factory=frozenset)
 
+    def __post_init__(self):
+        for name in ("when_all", "when_any", "when_none"):
+            keys = getattr(self, name)
+            if type(keys) is not frozenset:
+                object.__setattr__(self, name, frozenset(keys))
+
     def matches(self, fact_keys: AbstractSet[str]) -> bool:
         # ALL
         if not self.when_all.issubset(fact_keys):
             return False
 
         # ANY (if specified)
-        if self.when_any and not self.when_any.intersection(fact_keys):
+        if self.when_any and self.when_any.isdisjoint(fact_keys):
             return False
 
         # NONE
-        if self.when_none.intersection(fact_keys):
+        if not self.when_none.isdisjoint(fact_keys):
             return False
 
         return True
@@ -1,4 +1,6 @@
-from typing import Any, Iterable, List
+import sys
+from functools import lru_cache
+from typing import Any, Iterable, Tuple
 
 from actionpack.procedure import KeyedProcedure
 
@@ -17,8 +19,23 @@ class ProcedureTemplate:
     """
 
     def __init__(self, name: str, actions: Iterable[SlaterAction]):
-        self.name = name
-        self._actions: List[SlaterAction] = list(actions)
+        self._name = sys.intern(name)
+        self._actions: Tuple[SlaterAction, ...] = tuple(actions)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @classmethod
+    @lru_cache(maxsize=64)
+    def empty(cls, name: str) -> "ProcedureTemplate":
+        """
+        Return a shared template with no actions.
+
+        Templates are immutable (name and actions are read-only), so one
+        instance per name is reused.
+        """
+        return cls(name=name, actions=())
 
     def materialize(self, state: dict[str, Any], ctx: IterationContextView) -> KeyedProcedure:
         """
@@ -6,15 +6,20 @@ behavior that can be validated, visualized, and executed.
 """
 
 import warnings
+from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, Set, Type
+from typing import AbstractSet, Dict, List, Mapping, Set, Type
 
 from slater.phases import PhaseRule
 from slater.policies import ControlPolicy, TransitionPolicy
 from slater.procedures import ProcedureTemplate
 
 
+class UndefinedPhaseWarning(UserWarning):
+    """An AgentSpec defines Procedures for Phases it does not declare."""
+
+
 @dataclass
 class AgentSpec:
     """
@@ -32,10 +37,10 @@ class AgentSpec:
 
     name: str
     version: str
-    phases: Set[Enum]
+    phases: AbstractSet[Enum]
     control_policy: ControlPolicy
     transition_policy: TransitionPolicy
-    procedures: Dict[Enum, ProcedureTemplate]
+    procedures: Mapping[Enum, ProcedureTemplate]
 
     def __post_init__(self):
         """Validate the spec at construction."""
@@ -43,6 +48,9 @@ class AgentSpec:
 
     def _validate(self):
         """Run all validation checks."""
+        # hashed once; membership checks below are O(1) against this set
+        self._phase_set = frozenset(self.phases)
+
         self._validate_name_and_version()
         self._validate_phases()
         self._validate_procedures()
@@ -79,23 +87,26 @@ class AgentSpec:
 
     def _validate_procedures(self):
         """Ensure every Phase has a Procedure."""
-        missing = self.phases - set(self.procedures.keys())
+        procedure_phases = self.procedures.keys()
+
+        missing = self._phase_set - procedure_phases
         if missing:
             raise ValueError(
                 f"AgentSpec '{self.name}' missing Procedures for Phases: {missing}"
             )
 
         # Check for extra procedures (warning, not error)
-        extra = set(self.procedures.keys()) - self.phases
+        extra = procedure_phases - self._phase_set
         if extra:
             warnings.warn(
-                f"AgentSpec '{self.name}' has Procedures for undefined Phases: {extra}"
+                f"AgentSpec '{self.name}' has Procedures for undefined Phases: {extra}",
+                UndefinedPhaseWarning,
             )
 
     def _validate_transition_policy(self):
         """Ensure TransitionPolicy references valid Phases."""
         # Check default Phase
-        if self.transition_policy.default not in self.phases:
+        if self.transition_policy.default not in self._phase_set:
             raise ValueError(
                 f"TransitionPolicy.default references unknown Phase: "
                 f"{self.transition_policy.default}"
@@ -103,7 +114,7 @@ class AgentSpec:
 
         # Check all rules reference valid Phases
         for i, rule in enumerate(self.transition_policy.rules):
-            if rule.enter not in self.phases:
+            if rule.enter not in self._phase_set:
                 raise ValueError(
                     f"PhaseRule[{i}] references unknown Phase: {rule.enter}"
                 )
@@ -115,27 +126,41 @@ class AgentSpec:
         """
         Ensure PhaseRules don't overlap (non-deterministic behavior).
 
-        Two rules overlap if they could both match the same fact set.
+        Two unconditional rules (no when_any/when_none) overlap if one's
+        when_all is a subset of the other's: the narrower rule then fires
+        whenever the broader one does, and derive_phase() would raise.
         This is a simplified check; full coverage would require SAT solving.
         """
         rules = self.transition_policy.rules
 
-        for i, rule_a in enumerate(rules):
-            for j, rule_b in enumerate(rules[i + 1 :], start=i + 1):
-                # Simple overlap check: identical when_all
-                if rule_a.when_all == rule_b.when_all:
-                    # If when_any/when_none differ, might still be deterministic
-                    if (
-                        not rule_a.when_any
-                        and not rule_a.when_none
-                        and not rule_b.when_any
-                        and not rule_b.when_none
-                    ):
-                        raise ValueError(
-                            f"PhaseRules overlap (non-deterministic):\n"
-                            f"  Rule {i}: enter={rule_a.enter}, when_all={rule_a.when_all}\n"
-                            f"  Rule {j}: enter={rule_b.enter}, when_all={rule_b.when_all}"
-                        )
+        # fact key -> indices of unconditional rules requiring it
+        unconditional: List[int] = []
+        index: Dict[str, Set[int]] = defaultdict(set)
+        for i, rule in enumerate(rules):
+            # If when_any/when_none are set, might still be deterministic
+            if rule.when_any or rule.when_none:
+                continue
+            unconditional.append(i)
+            for key in rule.when_all:
+                index[key].add(i)
+
+        for i in unconditional:
+            # rules requiring every key this one requires (all, if it requires none)
+            postings = [index[key] for key in rules[i].when_all]
+            if postings:
+                supersets = min(postings, key=len).intersection(*postings)
+            else:
+                supersets = set(unconditional)
+            supersets.discard(i)
+
+            if supersets:
+                a, b = sorted((i, min(supersets)))
+                rule_a, rule_b = rules[a], rules[b]
+                raise ValueError(
+                    f"PhaseRules overlap (non-deterministic):\n"
+                    f"  Rule {a}: enter={rule_a.enter}, when_all={rule_a.when_all}\n"
+                    f"  Rule {b}: enter={rule_b.enter}, when_all={rule_b.when_all}"
+                )
 
     def _validate_control_policy(self):
         """
@@ -144,11 +169,13 @@ class AgentSpec:
         Could cross-reference with FactRegistry if implemented,
         ensuring completion_keys are ProgressFacts, etc.
         """
-        # Check for key overlap (may or may not be desired)
-        completion_and_failure = (
-            self.control_policy.completion_keys & self.control_policy.failure_keys
-        )
-        if completion_and_failure:
+        completion_keys = self.control_policy.completion_keys
+        failure_keys = self.control_policy.failure_keys
+
+        # Check for key overlap (may or may not be desired);
+        # the intersection is only materialized for the error message
+        if not completion_keys.isdisjoint(failure_keys):
+            completion_and_failure = completion_keys & failure_keys
             raise ValueError(
                 f"ControlPolicy has keys in both completion_keys and failure_keys: "
                 f"{completion_and_failure}"
@@ -1,7 +1,7 @@
 import json
 import time
 from pathlib import Path
-from typing import Any, Protocol
+from typing import Any, Iterator, Protocol
 
 from slater.config import BootstrapConfig
 from slater.types import Fact, Facts, IterationFacts, KnowledgeFact
@@ -11,6 +11,7 @@ class StateStore(Protocol):
     def save(self, agent_id: str, iteration_facts: IterationFacts, persistent_facts: Facts) -> None: ...
     def load(self, agent_id: str) -> Facts: ...
     def history(self, agent_id: str) -> list[IterationFacts]: ...
+    def history_iter(self, agent_id: str) -> Iterator[IterationFacts]: ...
     def bootstrap(self, agent_id: str, config: BootstrapConfig) -> None:
         """
         Seed initial state from bootstrap config.
@@ -58,14 +59,18 @@ class IterationState:
     # ---- dict-like projection (read-only) ----
 
     def __getitem__(self, key: str):
-        if key in self._iteration:
-            return self._iteration[key].value
-        return self._persistent[key].value
+        fact = self._iteration.get(key)
+        if fact is None:
+            fact = self._persistent[key]
+        return fact.value
 
     def get(self, key: str, default=None):
-        if key in self._iteration:
-            return self._iteration[key].value
-        return self._persistent.get(key, Fact(key, default)).value
+        fact = self._iteration.get(key)
+        if fact is None:
+            fact = self._persistent.get(key)
+            if fact is None:
+                return default
+        return fact.value
 
     def __contains__(self, key: str) -> bool:
         return key in self._iteration or key in self._persistent
@@ -88,10 +93,25 @@ class IterationState:
         """
         return Facts.unflatten(self._persistent)
 
+    def persistent_keys(self) -> frozenset[str]:
+        """
+        Fully-qualified keys of durable (session + persistent) facts.
+
+        Equivalent to the keys of persistent_facts().serialize(), without
+        rebuilding or serializing the Facts tree.
+        """
+        return frozenset(self._persistent)
+
 
 BOOTSTRAP_PHASE = "__bootstrap__"
 
 class InMemoryStateStore:
+    """
+    Process-local StateStore for tests and development.
+
+    Facts are stored and returned by reference (no copies on save/load),
+    so callers must treat loaded Facts as read-only.
+    """
     def __init__(self):
         # agent_id -> persistent Facts
         self._persistent: dict[str, Facts] = {}
@@ -164,7 +184,13 @@ class InMemoryStateStore:
     # ---- introspection helpers (tests / UI) ----
 
     def history(self, agent_id: str) -> list[IterationFacts]:
-        return list(self._history.get(agent_id, []))
+        return list(self.history_iter(agent_id))
+
+    def history_iter(self, agent_id: str) -> Iterator[IterationFacts]:
+        """
+        Iterate recorded IterationFacts without copying the history list.
+        """
+        return iter(self._history.get(agent_id, ()))
 
 
 class FileSystemStateStore:
@@ -185,12 +211,13 @@ class FileSystemStateStore:
         # Save current persistent state (snapshot)
         state_path = self._path(agent_id)
         tmp = state_path.with_suffix(".tmp")
-        json.dump(
-            persistent_facts.serialize(),
-            tmp.open("w"),
-            indent=2,
-            sort_keys=True,
-        )
+        with tmp.open("w") as f:
+            json.dump(
+                persistent_facts.serialize(),
+                f,
+                indent=2,
+                sort_keys=True,
+            )
         tmp.replace(state_path)
 
         # Add timestamp if not already present
@@ -218,16 +245,27 @@ class FileSystemStateStore:
         (the enum member name) rather than an Enum, since we cannot reconstruct
         the original enum class from storage.
         """
+        return list(self.history_iter(agent_id))
+
+    def history_iter(self, agent_id: str) -> Iterator[IterationFacts]:
+        """
+        Stream iteration history one record at a time.
+
+        The raw lines are read up front, so the file is closed before the
+        first record is yielded and an abandoned iterator holds no handle.
+        Records are deserialized lazily, so callers scanning for a single
+        record skip decoding the rest of the audit trail.
+        """
         history_path = self._history_path(agent_id)
         if not history_path.exists():
-            return []
+            return
 
-        records = []
         with history_path.open("r") as f:
-            for line in f:
-                if line.strip():
-                    records.append(IterationFacts.deserialize(json.loads(line)))
-        return records
+            lines = f.readlines()
+
+        for line in lines:
+            if line.strip():
+                yield IterationFacts.deserialize(json.loads(line))
 
     def bootstrap(self, agent_id: str, config: BootstrapConfig) -> None:
         """
@@ -267,10 +305,11 @@ class FileSystemStateStore:
         seed = Facts(**seed_facts)
 
         tmp = path.with_suffix(".tmp")
-        json.dump(
-            seed.serialize(),
-            tmp.open("w"),
-            indent=2,
-            sort_keys=True,
-        )
+        with tmp.open("w") as f:
+            json.dump(
+                seed.serialize(),
+                f,
+                indent=2,
+                sort_keys=True,
+            )
         tmp.replace(path)
@@ -1,43 +1,90 @@
 import json
+import math
+import re
+import sys
+from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from openai import OpenAI
 from typing import (
     Any,
     Dict,
+    Iterable,
     Iterator,
     Mapping,
     Optional,
     Protocol,
     Sequence,
     Literal,
+    Tuple,
     Union,
 )
 
+try:
+    import orjson
+except ImportError:  # optional: pip install slater[fast]
+    orjson = None
+
 
 # Phase enum is now dynamically created per agent via PhaseEnum
 
+# value types json.dumps always accepts (exact types: subclasses may not be)
+_JSON_SCALARS = frozenset({str, int, float, bool, type(None)})
 
-@dataclass(frozen=True)
+
+def _is_plain_json(value: Any) -> bool:
+    """True if orjson and stdlib json encode value to the same JSON data."""
+    t = type(value)
+    if t is str or t is bool or value is None:
+        return True
+    if t is int:
+        # orjson's integer range (i64 min .. u64 max)
+        return -(2**63) <= value < 2**64
+    if t is float:
+        return math.isfinite(value)
+    if t is list or t is tuple:
+        return all(map(_is_plain_json, value))
+    if t is dict:
+        return all(type(k) is str for k in value) and all(map(_is_plain_json, value.values()))
+    return False
+
+
+# digit runs of 19+ may fall outside orjson's i64/u64 range (negatives
+# below -2**63 already have 19 digits); indexed by `type(data) is str`
+_LONG_NUMBER = (re.compile(rb"[0-9]{19,}"), re.compile(r"[0-9]{19,}"))
+
+
+@dataclass(frozen=True, slots=True)
 class StateFragment:
     data: dict[str, Any]
     scope: Literal["iteration", "session"] = "iteration"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Fact:
     key: str
     value: Any
     scope: Literal["iteration", "session", "persistent"] = "iteration"
 
+    def __post_init__(self):
+        # keys and scopes repeat across many Facts (notably after JSON loads,
+        # which allocates a fresh string per value); intern to share them
+        if type(self.key) is str:
+            object.__setattr__(self, "key", sys.intern(self.key))
+        if type(self.scope) is str:
+            object.__setattr__(self, "scope", sys.intern(self.scope))
+
     def serialize(self) -> dict:
-        # enforce JSON-serializable value
-        try:
-            json.dumps(self.value)
-        except TypeError as e:
-            raise TypeError(
-                f"Fact '{self.key}' has non-JSON-serializable value: {self.value!r}"
-            ) from e
+        # enforce JSON-serializable value; scalars always are, so only
+        # containers and other types pay for a trial json.dumps
+        if type(self.value) not in _JSON_SCALARS:
+            try:
+                json.dumps(self.value)
+            except TypeError as e:
+                raise TypeError(
+                    f"Fact '{self.key}' has non-JSON-serializable value: {self.value!r}"
+                ) from e
 
         return {
             "key": self.key,
@@ -47,18 +94,17 @@ class Fact:
 
     @classmethod
     def deserialize(cls, data: dict) -> "Fact":
-        return cls(
-            key=data["key"],
-            value=data["value"],
-            scope=data["scope"],
-        )
+        # positional (key, value, scope): skips keyword binding on this hot
+        # path while still running __post_init__
+        return cls(data["key"], data["value"], data["scope"])
 
 
-class ProgressFact(Fact): ...
-class AuthorizationFact(Fact): ...
-class KnowledgeFact(Fact): ...
-class ArtifactFact(Fact): ...
-class DiagnosticFact(Fact): ...
+# empty __slots__ keep subclasses dict-free like Fact itself
+class ProgressFact(Fact): __slots__ = ()
+class AuthorizationFact(Fact): __slots__ = ()
+class KnowledgeFact(Fact): __slots__ = ()
+class ArtifactFact(Fact): __slots__ = ()
+class DiagnosticFact(Fact): __slots__ = ()
 
 
 class FactType(Enum):
@@ -71,6 +117,12 @@ class FactType(Enum):
 FactsValue = Union["Fact", "Facts"]
 
 
+@lru_cache(maxsize=4096)
+def _split_key(fq_key: str) -> Tuple[str, ...]:
+    """Split a dotted key into interned segments (cached: keys recur across records)."""
+    return tuple(map(sys.intern, fq_key.split(".")))
+
+
 class Facts(dict[str, FactsValue]):
     """
     A keyed collection of Facts.
@@ -120,32 +172,75 @@ class Facts(dict[str, FactsValue]):
           Facts(repo=Facts(file_count=Fact(...))).iter_facts()
           -> ("repo.file_count", Fact(...))
         """
-        for key, item in self.items():
-            fq = f"{prefix}.{key}" if prefix else key
-            if isinstance(item, Facts):
-                yield from item.iter_facts(prefix=fq)
+        # iterative depth-first walk: same order as recursion, but each leaf
+        # is yielded once instead of through a generator frame per level
+        # each frame holds its node's dotted prefix ("" at the root, else
+        # "a.b."), built once per node rather than per key
+        stack = [(f"{prefix}." if prefix else "", iter(self.items()))]
+        while stack:
+            dotted, items = stack[-1]
+            for key, item in items:
+                fq = dotted + key
+                # leaves dominate, so test for them first; isinstance (not an
+                # exact type check) so Facts subclasses still nest, as __init__ allows
+                if not isinstance(item, Facts):
+                    yield (fq, item)
+                    continue
+                stack.append((fq + ".", iter(item.items())))
+                break
             else:
-                # item is Fact
-                yield (fq, item)
+                stack.pop()
 
     def serialize(self) -> dict[str, dict]:
         """
         Flatten nested Facts into fully-qualified keys -> serialized Fact dicts (JSON-safe).
         """
-        flat: dict[str, dict] = {}
+        # one pass; scalar values are JSON-safe by type and emitted inline,
+        # only other values go through Fact.serialize's trial json.dumps
+        # (which raises naming the offending Fact)
+        scalars = _JSON_SCALARS
+        return {
+            fq_key: (
+                {"key": fact.key, "value": fact.value, "scope": fact.scope}
+                if type(fact.value) in scalars
+                else fact.serialize()
+            )
+            for fq_key, fact in self.iter_facts()
+        }
 
-        def walk(prefix: str, node: "Facts"):
-            for key, item in node.items():
-                fq_key = f"{prefix}.{key}" if prefix else key
+    def dump_json(self) -> bytes:
+        """
+        Encode to JSON bytes; decodes to the same data as json.dumps(serialize()).
 
-                if isinstance(item, Facts):
-                    walk(fq_key, item)
-                else:
-                    # item is a Fact (or subclass)
-                    flat[fq_key] = item.serialize()
+        Uses orjson when installed (the `fast` extra) and every value is plain
+        JSON data both encoders treat alike. Anything else (NaN, ints beyond
+        64 bits, non-str keys, types orjson encodes natively but json rejects,
+        such as datetime or UUID) goes through stdlib json, so the result and
+        any TypeError do not depend on whether orjson is installed.
+        """
+        payload = self._payload()
+        if orjson is not None and all(_is_plain_json(f["value"]) for f in payload.values()):
+            try:
+                return orjson.dumps(payload)
+            except TypeError:
+                pass  # e.g. lone surrogates, which json escapes but orjson rejects
+        try:
+            return json.dumps(payload).encode()
+        except TypeError:
+            self._raise_for_non_json()
+            raise
 
-        walk("", self)
-        return flat
+    def _payload(self) -> dict[str, dict]:
+        # one pass emitting the Fact dicts inline
+        return {
+            fq_key: {"key": fact.key, "value": fact.value, "scope": fact.scope}
+            for fq_key, fact in self.iter_facts()
+        }
+
+    def _raise_for_non_json(self) -> None:
+        # re-check per Fact so the error names the offending one
+        for _, fact in self.iter_facts():
+            fact.serialize()
 
     def flatten(self) -> Dict[str, Fact]:
         """
@@ -153,7 +248,7 @@ class Facts(dict[str, FactsValue]):
 
         This is a pure structural operation - returns Fact objects (not serialized).
         """
-        return {fq: fact for fq, fact in self.iter_facts()}
+        return dict(self.iter_facts())
 
     @classmethod
     def unflatten(cls, flat: Dict[str, Fact]) -> "Facts":
@@ -162,15 +257,33 @@ class Facts(dict[str, FactsValue]):
 
         This is a pure structural operation - values must already be Fact objects.
         """
-        root = Facts()
+        return cls._from_paths((_split_key(fq_key), fact) for fq_key, fact in flat.items())
+
+    @classmethod
+    def unflatten_tuples(cls, flat: Dict[Tuple[str, ...], Fact]) -> "Facts":
+        """
+        Like unflatten(), but keyed by pre-split paths: ("repo", "root") -> Fact.
 
-        for fq_key, fact in flat.items():
-            parts = fq_key.split(".")
+        Skips key splitting entirely for callers that already hold paths.
+        """
+        return cls._from_paths(flat.items())
+
+    @staticmethod
+    def _from_paths(pairs: Iterable[tuple[Sequence[str], Fact]]) -> "Facts":
+        """Build a nested Facts tree from (path, Fact) pairs."""
+        # groups are filled via __setitem__ from already-typed Facts, so skip
+        # the validating __init__ and allocate them directly
+        new_group = Facts.__new__
+        root = new_group(Facts)
+
+        for parts, fact in pairs:
             current = root
             for part in parts[:-1]:
-                if part not in current:
-                    current[part] = Facts()
-                current = current[part]  # type: ignore
+                # one lookup per segment on the (common) shared-prefix path
+                group = current.get(part)
+                if group is None:
+                    group = current[part] = new_group(Facts)
+                current = group  # type: ignore
             current[parts[-1]] = fact
 
         return root
@@ -180,9 +293,28 @@ class Facts(dict[str, FactsValue]):
         """
         Reconstitute Facts from serialized form (inverse of serialize).
 
-        Composes: Fact.deserialize (type transform) + unflatten (structure transform)
+        Composes: Fact.deserialize (type transform) + unflatten (structure transform),
+        building the tree in a single pass.
         """
-        return cls.unflatten({k: Fact.deserialize(v) for k, v in flat.items()})
+        # bound once rather than resolved per item
+        to_fact = Fact.deserialize
+        return cls._from_paths((_split_key(k), to_fact(v)) for k, v in flat.items())
+
+    @classmethod
+    def load_json(cls, data: Union[bytes, str]) -> "Facts":
+        """
+        Decode JSON produced by dump_json (inverse of dump_json).
+
+        Like dump_json, falls back to stdlib json where orjson would differ:
+        numbers that may not fit 64 bits (which orjson reads as floats) and
+        tokens only json accepts (NaN, Infinity, lone surrogates).
+        """
+        if orjson is not None and not _LONG_NUMBER[type(data) is str].search(data):
+            try:
+                return cls.deserialize(orjson.loads(data))
+            except orjson.JSONDecodeError:
+                pass
+        return cls.deserialize(json.loads(data))
 
 
 @dataclass(frozen=True)
@@ -215,6 +347,31 @@ class IterationFacts:
             },
         }
 
+    def serialize_all(self) -> Dict[str, dict]:
+        """
+        Flatten every action's Facts into one JSON-safe dict keyed "Action.fq_key".
+
+        Actions become top-level groups of a single tree, so the whole record
+        is serialized in one walk into one dict.
+        """
+        return Facts(**self.by_action).serialize()
+
+    def to_columns(self) -> Dict[str, Dict[str, Fact]]:
+        """
+        Columnar view of by_action: fully-qualified fact key -> {action: Fact}.
+
+        Built from by_action on each call, so it reflects later mutations of
+        the per-action Facts.
+        """
+        # column keys are interned: every record in a history repeats the
+        # same dotted keys, so views kept across records share those strings
+        intern = sys.intern
+        columns: Dict[str, Dict[str, Fact]] = defaultdict(dict)
+        for action, facts in self.by_action.items():
+            for fq_key, fact in facts.iter_facts():
+                columns[intern(fq_key)][action] = fact
+        return dict(columns)
+
     @classmethod
     def deserialize(cls, data: dict) -> "IterationFacts":
         """
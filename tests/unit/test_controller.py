@@ -10,6 +10,8 @@ These tests verify:
 - Cycle detection
 """
 
+from functools import partial
+
 import pytest
 
 from slater.actions import SlaterAction
@@ -36,11 +38,6 @@ class EmitSessionFact(SlaterAction):
         self._key = key
         self._value = value
 
-    def _clone(self):
-        clone = EmitSessionFact(key=self._key, value=self._value)
-        clone.name = self.name or self.__class__.__name__
-        return clone
-
     def instruction(self):
         return Facts(**{
             self._key: KnowledgeFact(
@@ -59,11 +56,6 @@ class EmitIterationFact(SlaterAction):
         self._key = key
         self._value = value
 
-    def _clone(self):
-        clone = EmitIterationFact(key=self._key, value=self._value)
-        clone.name = self.name or self.__class__.__name__
-        return clone
-
     def instruction(self):
         return Facts(**{
             self._key: KnowledgeFact(
@@ -88,6 +80,18 @@ class EmitCompletionFact(SlaterAction):
         )
 
 
+class EmitFailure(SlaterAction):
+    """Action that emits a failure signal."""
+    requires_state = True
+
+    # the Fact is immutable and shared; the Facts wrapper is mutable (and
+    # kept by reference in history), so each run gets a fresh one
+    _blocked = ProgressFact(key="blocked", value=True, scope="session")
+
+    def instruction(self):
+        return Facts(blocked=self._blocked)
+
+
 class ReadAndEmit(SlaterAction):
     """Action that reads a fact from state and emits a new fact."""
     requires_state = True
@@ -95,22 +99,12 @@ class ReadAndEmit(SlaterAction):
     def __init__(self, read_key: str, emit_key: str):
         self._read_key = read_key
         self._emit_key = emit_key
-
-    def _clone(self):
-        clone = ReadAndEmit(read_key=self._read_key, emit_key=self._emit_key)
-        clone.name = self.name or self.__class__.__name__
-        return clone
+        self._make_fact = partial(KnowledgeFact, key=emit_key, scope="session")
 
     def instruction(self):
         # Read from state (tests eager fact application)
         value = self.state[self._read_key]
-        return Facts(**{
-            self._emit_key: KnowledgeFact(
-                key=self._emit_key,
-                value=f"read_{value}",
-                scope="session",
-            )
-        })
+        return Facts(**{self._emit_key: self._make_fact(value=f"read_{value}")})
 
 
 class AssertFactExists(SlaterAction):
@@ -121,11 +115,6 @@ class AssertFactExists(SlaterAction):
         self._key = key
         self._expected = expected_value
 
-    def _clone(self):
-        clone = AssertFactExists(key=self._key, expected_value=self._expected)
-        clone.name = self.name or self.__class__.__name__
-        return clone
-
     def instruction(self):
         assert self._key in self.state, f"Expected fact '{self._key}' not in state"
         if self._expected is not None:
@@ -143,13 +132,6 @@ class AssertFactNotInStore(SlaterAction):
         self._agent_id = agent_id
         self._key = key
 
-    def _clone(self):
-        clone = AssertFactNotInStore(
-            store=self._store, agent_id=self._agent_id, key=self._key
-        )
-        clone.name = self.name or self.__class__.__name__
-        return clone
-
     def instruction(self):
         loaded = self._store.load(self._agent_id)
         assert self._key not in loaded, \
@@ -197,7 +179,7 @@ class TestEagerFactApplication:
                     EmitCompletionFact(),
                 ],
             ),
-            Phase.DONE: ProcedureTemplate(name="done", actions=[]),
+            Phase.DONE: ProcedureTemplate.empty("done"),
         }
 
         spec = AgentSpec(
@@ -243,7 +225,7 @@ class TestEagerFactApplication:
                     EmitCompletionFact(),
                 ],
             ),
-            Phase.DONE: ProcedureTemplate(name="done", actions=[]),
+            Phase.DONE: ProcedureTemplate.empty("done"),
         }
 
         spec = AgentSpec(
@@ -292,7 +274,7 @@ class TestFactScopes:
                     EmitCompletionFact(),
                 ],
             ),
-            Phase.DONE: ProcedureTemplate(name="done", actions=[]),
+            Phase.DONE: ProcedureTemplate.empty("done"),
         }
 
         spec = AgentSpec(
@@ -343,7 +325,7 @@ class TestFactScopes:
                     EmitCompletionFact(),
                 ],
             ),
-            Phase.DONE: ProcedureTemplate(name="done", actions=[]),
+            Phase.DONE: ProcedureTemplate.empty("done"),
         }
 
         spec = AgentSpec(
@@ -400,7 +382,7 @@ class TestStatePersistenceBoundaries:
                     EmitCompletionFact(),
                 ],
             ),
-            Phase.DONE: ProcedureTemplate(name="done", actions=[]),
+            Phase.DONE: ProcedureTemplate.empty("done"),
         }
 
         spec = AgentSpec(
@@ -452,7 +434,7 @@ class TestIterationHistory:
                     EmitCompletionFact(),
                 ],
             ),
-            Phase.DONE: ProcedureTemplate(name="done", actions=[]),
+            Phase.DONE: ProcedureTemplate.empty("done"),
         }
 
         spec = AgentSpec(
@@ -478,10 +460,10 @@ class TestIterationHistory:
 
         controller.run()
 
-        history = store.history(agent_id)
-        assert len(history) == 1
+        records = list(store.history_iter(agent_id))
+        assert len(records) == 1
 
-        iteration_record = history[0]
+        iteration_record = records[0]
         assert iteration_record.iteration == 1
         assert iteration_record.phase == Phase.START
         assert "EmitSessionFact" in iteration_record.by_action
@@ -542,8 +524,12 @@ class TestCycleDetection:
             state_store=store,
         )
 
+        # Smallest threshold that still requires a repeated phase:
+        # iteration 1 runs STUCK, iteration 2 re-enters it and raises
         with pytest.raises(RuntimeError, match="cycle detected"):
-            controller.run(max_same_phase=3)
+            controller.run(max_same_phase=2)
+
+        assert len(list(store.history_iter(agent_id))) == 1
 
 
 # ----------------------------------------------------------------------------
@@ -573,7 +559,7 @@ class TestPhaseTransitions:
                     EmitCompletionFact(),
                 ],
             ),
-            Phase.DONE: ProcedureTemplate(name="done", actions=[]),
+            Phase.DONE: ProcedureTemplate.empty("done"),
         }
 
         spec = AgentSpec(
@@ -608,10 +594,8 @@ class TestPhaseTransitions:
         controller.run()
 
         # Verify both phases executed
-        history = store.history(agent_id)
-        phases_executed = [h.phase for h in history]
-        assert Phase.GATHERING in phases_executed
-        assert Phase.PROCESSING in phases_executed
+        phases_executed = {h.phase for h in store.history_iter(agent_id)}
+        assert {Phase.GATHERING, Phase.PROCESSING}.issubset(phases_executed)
 
 
 # ----------------------------------------------------------------------------
@@ -633,7 +617,7 @@ class TestCompletionAndFailure:
                     EmitCompletionFact(),
                 ],
             ),
-            Phase.DONE: ProcedureTemplate(name="done", actions=[]),
+            Phase.DONE: ProcedureTemplate.empty("done"),
         }
 
         spec = AgentSpec(
@@ -669,21 +653,12 @@ class TestCompletionAndFailure:
         agent_id = "test-failure"
 
         Phase = phase
-
-        class EmitFailure(SlaterAction):
-            requires_state = True
-
-            def instruction(self):
-                return Facts(
-                    blocked=ProgressFact(key="blocked", value=True, scope="session")
-                )
-
         procedures = {
             Phase.START: ProcedureTemplate(
                 name="fail",
                 actions=[EmitFailure()],
             ),
-            Phase.DONE: ProcedureTemplate(name="done", actions=[]),
+            Phase.DONE: ProcedureTemplate.empty("done"),
         }
 
         spec = AgentSpec(
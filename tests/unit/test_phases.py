@@ -5,9 +5,11 @@ These tests ensure phase creation is validated and consistent.
 """
 
 import pytest
+import sys
 from enum import Enum
+from operator import attrgetter
 
-from slater.phases import PhaseEnum
+from slater.phases import PhaseEnum, PhaseRule
 
 
 # ----------------------------------------------------------------------------
@@ -20,8 +22,9 @@ class TestPhaseEnumCreate:
         """Create phases from simple names."""
         Phase = PhaseEnum.create("START", "DONE")
 
-        assert hasattr(Phase, "START")
-        assert hasattr(Phase, "DONE")
+        members = Phase.__members__
+        assert "START" in members
+        assert "DONE" in members
         assert Phase.START.name == "START"
         assert Phase.DONE.name == "DONE"
 
@@ -53,6 +56,22 @@ class TestPhaseEnumCreate:
 
         assert MyPhases.__name__ == "MyPhases"
 
+    def test_create_is_memoized(self):
+        """Back-to-back identical calls hit the class cache; differing calls do not."""
+        Phase = PhaseEnum.create("START", "DONE")
+
+        assert PhaseEnum.create("START", "DONE") is Phase
+        assert PhaseEnum.from_list(["START", "DONE"]) is Phase
+        assert PhaseEnum.create("DONE", "START") is not Phase
+        assert PhaseEnum.create("START", "DONE", class_name="Other") is not Phase
+
+    def test_create_interns_names(self):
+        """Member names are interned strings."""
+        name = "".join(["INTERN", "_ME"])  # built at runtime, not a literal
+        Phase = PhaseEnum.create(name)
+
+        assert Phase.INTERN_ME.name is sys.intern("INTERN_ME")
+
     def test_create_preserves_order(self):
         """Phase values are assigned in order."""
         Phase = PhaseEnum.create("FIRST", "SECOND", "THIRD")
@@ -91,18 +110,16 @@ class TestPhaseEnumFromSet:
         names = {"START", "PROCESSING", "DONE"}
         Phase = PhaseEnum.from_set(names)
 
-        assert hasattr(Phase, "START")
-        assert hasattr(Phase, "PROCESSING")
-        assert hasattr(Phase, "DONE")
+        assert {"START", "PROCESSING", "DONE"} <= Phase.__members__.keys()
 
     def test_from_set_sorts_alphabetically(self):
         """from_set sorts names alphabetically for determinism."""
         Phase = PhaseEnum.from_set({"ZEBRA", "ALPHA", "MIDDLE"})
 
-        values = [(p.name, p.value) for p in Phase]
-        names = [name for name, _ in values]
+        by_value = sorted(Phase, key=attrgetter("value"))
 
-        assert names == ["ALPHA", "MIDDLE", "ZEBRA"]
+        assert [p.name for p in by_value] == ["ALPHA", "MIDDLE", "ZEBRA"]
+        assert by_value == list(Phase)
 
 
 # ----------------------------------------------------------------------------
@@ -116,45 +133,35 @@ class TestPhaseEnumValidation:
         with pytest.raises(ValueError, match="At least one phase name"):
             PhaseEnum.create()
 
-    def test_lowercase_raises(self):
-        """Lowercase names raise ValueError."""
-        with pytest.raises(ValueError, match="UPPER_SNAKE_CASE"):
-            PhaseEnum.create("start")
-
-    def test_mixed_case_raises(self):
-        """Mixed case names raise ValueError."""
-        with pytest.raises(ValueError, match="UPPER_SNAKE_CASE"):
-            PhaseEnum.create("Start")
-
-    def test_leading_number_raises(self):
-        """Names starting with numbers raise ValueError."""
-        with pytest.raises(ValueError, match="UPPER_SNAKE_CASE"):
-            PhaseEnum.create("1STEP")
-
-    def test_spaces_raise(self):
-        """Names with spaces raise ValueError."""
-        with pytest.raises(ValueError, match="UPPER_SNAKE_CASE"):
-            PhaseEnum.create("MY PHASE")
-
-    def test_hyphens_raise(self):
-        """Names with hyphens raise ValueError."""
-        with pytest.raises(ValueError, match="UPPER_SNAKE_CASE"):
-            PhaseEnum.create("MY-PHASE")
-
-    def test_reserved_name_none_raises(self):
-        """Reserved name NONE raises ValueError."""
-        with pytest.raises(ValueError, match="Reserved phase name"):
-            PhaseEnum.create("NONE")
-
-    def test_reserved_name_default_raises(self):
-        """Reserved name DEFAULT raises ValueError."""
-        with pytest.raises(ValueError, match="Reserved phase name"):
-            PhaseEnum.create("DEFAULT")
-
-    def test_reserved_name_all_raises(self):
-        """Reserved name ALL raises ValueError."""
-        with pytest.raises(ValueError, match="Reserved phase name"):
-            PhaseEnum.create("ALL")
+    @pytest.mark.parametrize(
+        "name, match",
+        [
+            ("start", "UPPER_SNAKE_CASE"),
+            ("Start", "UPPER_SNAKE_CASE"),
+            ("1STEP", "UPPER_SNAKE_CASE"),
+            ("MY PHASE", "UPPER_SNAKE_CASE"),
+            ("MY-PHASE", "UPPER_SNAKE_CASE"),
+            ("START\n", "UPPER_SNAKE_CASE"),
+            ("NONE", "Reserved phase name"),
+            ("DEFAULT", "Reserved phase name"),
+            ("ALL", "Reserved phase name"),
+        ],
+        ids=[
+            "lowercase",
+            "mixed_case",
+            "leading_number",
+            "spaces",
+            "hyphens",
+            "trailing_newline",
+            "reserved_none",
+            "reserved_default",
+            "reserved_all",
+        ],
+    )
+    def test_invalid_name_raises(self, name, match):
+        """Malformed or reserved names raise ValueError."""
+        with pytest.raises(ValueError, match=match):
+            PhaseEnum.create(name)
 
     def test_duplicate_names_raise(self):
         """Duplicate names raise ValueError."""
@@ -199,6 +206,10 @@ class TestPhaseEnumValidateMethod:
         result = PhaseEnum.validate(["invalid", "NONE", "duplicate", "duplicate"])
         assert result is False
 
+    def test_validate_handles_unhashable_names(self):
+        """Unhashable entries are invalid rather than a cache error."""
+        assert PhaseEnum.validate(["START", ["DONE"]]) is False
+
 
 # ----------------------------------------------------------------------------
 # Integration with PhaseRule
@@ -208,8 +219,6 @@ class TestPhaseEnumValidateMethod:
 class TestPhaseEnumWithPhaseRule:
     def test_dynamic_phase_works_with_phase_rule(self):
         """Dynamically created phases work with PhaseRule."""
-        from slater.phases import PhaseRule
-
         Phase = PhaseEnum.create("START", "PROCESSING", "DONE")
 
         rule = PhaseRule(
@@ -220,3 +229,23 @@ class TestPhaseEnumWithPhaseRule:
         assert rule.enter == Phase.DONE
         assert rule.matches({"task_complete", "other_fact"})
         assert not rule.matches({"other_fact"})
+
+    def test_phase_rule_stores_conditions_as_frozensets(self):
+        """PhaseRule normalizes conditions to frozensets and has no __dict__."""
+        Phase = PhaseEnum.create("START", "DONE")
+
+        rule = PhaseRule(
+            enter=Phase.DONE,
+            when_all={"task_complete"},
+            when_any=["a", "b"],
+            when_none=("blocked",),
+        )
+
+        assert rule.when_all == frozenset({"task_complete"})
+        assert type(rule.when_any) is frozenset
+        assert type(rule.when_none) is frozenset
+        assert not hasattr(rule, "__dict__")
+
+        assert rule.matches({"task_complete", "a"})
+        assert not rule.matches({"task_complete"})  # no ANY key
+        assert not rule.matches({"task_complete", "b", "blocked"})  # NONE key
@@ -5,13 +5,15 @@ These tests lock in Category 4 (FSM Safety) validation that occurs
 at AgentSpec construction time.
 """
 
+import dataclasses
+from types import MappingProxyType
+
 import pytest
-import warnings
 
 from slater.phases import Phase, PhaseRule
 from slater.policies import ControlPolicy, TransitionPolicy
 from slater.procedures import ProcedureTemplate
-from slater.spec import AgentSpec
+from slater.spec import AgentSpec, UndefinedPhaseWarning
 
 
 # ----------------------------------------------------------------------------
@@ -19,7 +21,15 @@ from slater.spec import AgentSpec
 # ----------------------------------------------------------------------------
 
 
-@pytest.fixture
+# Read-only baselines shared by every test in the module
+_PHASES = frozenset({Phase.READY_TO_CONTINUE, Phase.TASK_COMPLETE})
+_PROCEDURES = MappingProxyType({
+    Phase.READY_TO_CONTINUE: ProcedureTemplate.empty("ready"),
+    Phase.TASK_COMPLETE: ProcedureTemplate.empty("complete"),
+})
+
+
+@pytest.fixture(scope="module")
 def minimal_control_policy():
     return ControlPolicy(
         required_state_keys=set(),
@@ -29,7 +39,7 @@ def minimal_control_policy():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def minimal_transition_policy():
     return TransitionPolicy(
         rules=[],
@@ -37,17 +47,29 @@ def minimal_transition_policy():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def minimal_procedures():
-    return {
-        Phase.READY_TO_CONTINUE: ProcedureTemplate(name="ready", actions=[]),
-        Phase.TASK_COMPLETE: ProcedureTemplate(name="complete", actions=[]),
-    }
+    return _PROCEDURES
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def minimal_phases():
-    return {Phase.READY_TO_CONTINUE, Phase.TASK_COMPLETE}
+    return _PHASES
+
+
+@pytest.fixture(scope="module")
+def minimal_spec(
+    minimal_phases, minimal_control_policy, minimal_transition_policy, minimal_procedures
+):
+    """A validated AgentSpec shared by read-only tests."""
+    return AgentSpec(
+        name="test-agent",
+        version="1.0.0",
+        phases=minimal_phases,
+        control_policy=minimal_control_policy,
+        transition_policy=minimal_transition_policy,
+        procedures=minimal_procedures,
+    )
 
 
 # ----------------------------------------------------------------------------
@@ -56,59 +78,35 @@ def minimal_phases():
 
 
 class TestAgentSpecValid:
-    def test_minimal_valid_spec(
-        self, minimal_phases, minimal_control_policy, minimal_transition_policy, minimal_procedures
-    ):
+    def test_minimal_valid_spec(self, minimal_spec):
         """A minimal valid AgentSpec should construct without error."""
-        spec = AgentSpec(
-            name="test-agent",
-            version="1.0.0",
-            phases=minimal_phases,
-            control_policy=minimal_control_policy,
-            transition_policy=minimal_transition_policy,
-            procedures=minimal_procedures,
-        )
-
-        assert spec.name == "test-agent"
-        assert spec.version == "1.0.0"
+        assert minimal_spec.name == "test-agent"
+        assert minimal_spec.version == "1.0.0"
 
-    def test_describe_returns_string(
-        self, minimal_phases, minimal_control_policy, minimal_transition_policy, minimal_procedures
-    ):
+    def test_describe_returns_string(self, minimal_spec):
         """describe() should return a human-readable summary."""
-        spec = AgentSpec(
-            name="test-agent",
-            version="1.0.0",
-            phases=minimal_phases,
-            control_policy=minimal_control_policy,
-            transition_policy=minimal_transition_policy,
-            procedures=minimal_procedures,
-        )
-
-        description = spec.describe()
+        description = minimal_spec.describe()
 
         assert "test-agent" in description
         assert "1.0.0" in description
         assert "Phases" in description
 
-    def test_to_mermaid_returns_diagram(
-        self, minimal_phases, minimal_control_policy, minimal_transition_policy, minimal_procedures
-    ):
+    def test_to_mermaid_returns_diagram(self, minimal_spec):
         """to_mermaid() should return a valid Mermaid diagram."""
-        spec = AgentSpec(
-            name="test-agent",
-            version="1.0.0",
-            phases=minimal_phases,
-            control_policy=minimal_control_policy,
-            transition_policy=minimal_transition_policy,
-            procedures=minimal_procedures,
-        )
-
-        diagram = spec.to_mermaid()
+        diagram = minimal_spec.to_mermaid()
 
         assert "stateDiagram-v2" in diagram
         assert "[*]" in diagram
 
+    def test_describe_reflects_later_changes(self, minimal_spec):
+        """describe() renders the spec as it is now, not as first rendered."""
+        spec = dataclasses.replace(minimal_spec)
+        spec.describe()
+
+        spec.name = "renamed-agent"
+
+        assert "renamed-agent" in spec.describe()
+
 
 # ----------------------------------------------------------------------------
 # Name and version validation
@@ -116,27 +114,14 @@ class TestAgentSpecValid:
 
 
 class TestAgentSpecNameVersionValidation:
-    def test_empty_name_raises(
-        self, minimal_phases, minimal_control_policy, minimal_transition_policy, minimal_procedures
+    @pytest.mark.parametrize("name", ["", "   "], ids=["empty", "whitespace"])
+    def test_blank_name_raises(
+        self, name, minimal_phases, minimal_control_policy, minimal_transition_policy, minimal_procedures
     ):
-        """Empty name should raise ValueError."""
+        """Empty or whitespace-only name should raise ValueError."""
         with pytest.raises(ValueError, match="name cannot be empty"):
             AgentSpec(
-                name="",
-                version="1.0.0",
-                phases=minimal_phases,
-                control_policy=minimal_control_policy,
-                transition_policy=minimal_transition_policy,
-                procedures=minimal_procedures,
-            )
-
-    def test_whitespace_name_raises(
-        self, minimal_phases, minimal_control_policy, minimal_transition_policy, minimal_procedures
-    ):
-        """Whitespace-only name should raise ValueError."""
-        with pytest.raises(ValueError, match="name cannot be empty"):
-            AgentSpec(
-                name="   ",
+                name=name,
                 version="1.0.0",
                 phases=minimal_phases,
                 control_policy=minimal_control_policy,
@@ -200,12 +185,22 @@ class TestAgentSpecPhaseValidation:
 
 
 class TestAgentSpecProcedureValidation:
+    def test_shared_empty_template_is_read_only(self):
+        """empty() templates are shared per name, so their name cannot be rebound."""
+        template = ProcedureTemplate.empty("ready")
+
+        with pytest.raises(AttributeError):
+            template.name = "changed"
+
+        assert ProcedureTemplate.empty("ready") is template
+        assert template.name == "ready"
+
     def test_missing_procedure_raises(
         self, minimal_phases, minimal_control_policy, minimal_transition_policy
     ):
         """Missing Procedure for a Phase should raise ValueError."""
         incomplete_procedures = {
-            Phase.READY_TO_CONTINUE: ProcedureTemplate(name="ready", actions=[]),
+            Phase.READY_TO_CONTINUE: ProcedureTemplate.empty("ready"),
             # Missing Phase.TASK_COMPLETE
         }
 
@@ -225,12 +220,11 @@ class TestAgentSpecProcedureValidation:
         """Extra Procedure for undefined Phase should warn."""
         phases = {Phase.READY_TO_CONTINUE}
         procedures = {
-            Phase.READY_TO_CONTINUE: ProcedureTemplate(name="ready", actions=[]),
-            Phase.TASK_COMPLETE: ProcedureTemplate(name="extra", actions=[]),
+            Phase.READY_TO_CONTINUE: ProcedureTemplate.empty("ready"),
+            Phase.TASK_COMPLETE: ProcedureTemplate.empty("extra"),
         }
 
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
+        with pytest.warns(UndefinedPhaseWarning, match="undefined Phases"):
             AgentSpec(
                 name="test-agent",
                 version="1.0.0",
@@ -240,9 +234,6 @@ class TestAgentSpecProcedureValidation:
                 procedures=procedures,
             )
 
-            assert len(w) == 1
-            assert "undefined Phases" in str(w[0].message)
-
 
 # ----------------------------------------------------------------------------
 # TransitionPolicy validation
@@ -321,6 +312,33 @@ class TestAgentSpecTransitionPolicyValidation:
                 procedures=minimal_procedures,
             )
 
+    @pytest.mark.parametrize(
+        "narrow, broad",
+        [({"fact_a"}, {"fact_a", "fact_b"}), (set(), {"fact_a"})],
+        ids=["subset", "catch_all"],
+    )
+    def test_subset_rules_raise(
+        self, narrow, broad, minimal_phases, minimal_control_policy, minimal_procedures
+    ):
+        """A rule whose when_all is a subset of another's overlaps it."""
+        transition_policy = TransitionPolicy(
+            rules=[
+                PhaseRule(enter=Phase.TASK_COMPLETE, when_all=frozenset(broad)),
+                PhaseRule(enter=Phase.READY_TO_CONTINUE, when_all=frozenset(narrow)),
+            ],
+            default=Phase.READY_TO_CONTINUE,
+        )
+
+        with pytest.raises(ValueError, match=r"non-deterministic\):\n  Rule 0: .*\n  Rule 1: "):
+            AgentSpec(
+                name="test-agent",
+                version="1.0.0",
+                phases=minimal_phases,
+                control_policy=minimal_control_policy,
+                transition_policy=transition_policy,
+                procedures=minimal_procedures,
+            )
+
     def test_non_overlapping_rules_allowed(
         self, minimal_phases, minimal_control_policy, minimal_procedures
     ):
@@ -8,110 +8,136 @@ These tests lock in the fixes that ensure:
 4. TransitionPolicy.derive_phase() receives keys (AbstractSet[str])
 """
 
+import re
+from pathlib import Path
+
 import pytest
 
+from slater.config import BootstrapConfig, RepoConfig
+from slater.controller import AgentController
 from slater.phases import Phase, PhaseRule
 from slater.policies import TransitionPolicy
-from slater.state import InMemoryStateStore, IterationState
+from slater.state import FileSystemStateStore, InMemoryStateStore, IterationState
 from slater.types import Fact, Facts, IterationFacts, KnowledgeFact
 
 
-# ----------------------------------------------------------------------------
-# Issue 1: IterationState.__init__ stores Fact objects, not dicts
-# ----------------------------------------------------------------------------
+# Interchangeable StateStore constructors, each given a scratch directory
+STORE_FACTORIES = [
+    lambda root: InMemoryStateStore(),
+    lambda root: FileSystemStateStore(root=root),
+]
+STORE_IDS = ["inmemory", "filesystem"]
 
+# (config, expected flattened fact values) for each bootstrap shape.
+# RepoConfig validates paths with pathlib, which breaks under pyfakefs;
+# the configs are therefore built at import time.
+BOOTSTRAP_CASES = [
+    pytest.param(BootstrapConfig(), {}, id="empty"),
+    pytest.param(BootstrapConfig(goal="test goal"), {"goal": "test goal"}, id="goal_only"),
+    pytest.param(
+        BootstrapConfig(repo=RepoConfig(root="/path/to/repo")),
+        {"repo_root": "/path/to/repo"},
+        id="repo_no_ignore",
+    ),
+    pytest.param(
+        BootstrapConfig(goal="test goal", repo=RepoConfig(root="/path", ignore=["*.pyc"])),
+        {"goal": "test goal", "repo_root": "/path", "repo_ignore": ["*.pyc"]},
+        id="full",
+    ),
+]
 
-class TestIterationStateInit:
-    def test_persistent_contains_fact_objects(self):
-        """_persistent dict should contain Fact objects, not serialized dicts."""
-        base = Facts(
-            foo=Fact(key="foo", value="bar", scope="persistent"),
-        )
-        state = IterationState(base)
 
-        # Access internal _persistent directly to verify type
-        assert "foo" in state._persistent
-        stored = state._persistent["foo"]
-
-        # Must be a Fact object, not a dict
-        assert isinstance(stored, Fact), f"Expected Fact, got {type(stored)}"
-        assert stored.key == "foo"
-        assert stored.value == "bar"
-        assert stored.scope == "persistent"
-
-    def test_persistent_excludes_iteration_scoped_facts(self):
-        """Iteration-scoped facts should not be stored in _persistent."""
-        base = Facts(
-            durable=Fact(key="durable", value=1, scope="session"),
-            ephemeral=Fact(key="ephemeral", value=2, scope="iteration"),
-        )
-        state = IterationState(base)
+@pytest.fixture
+def make_iter_facts():
+    """Build IterationFacts with the defaults most tests use."""
+    def _make(iteration=1, phase=Phase.READY_TO_CONTINUE, by_action=None):
+        return IterationFacts(iteration=iteration, phase=phase, by_action=by_action or {})
+    return _make
 
-        assert "durable" in state._persistent
-        assert "ephemeral" not in state._persistent
 
-    def test_nested_facts_flattened_correctly(self):
-        """Nested Facts should be flattened with dot-notation keys."""
-        base = Facts(
-            repo=Facts(
-                root=Fact(key="root", value="/path", scope="session"),
-            ),
-        )
-        state = IterationState(base)
+# pyfakefs' patcher setup is paid once per worker; under `--dist loadgroup`
+# the classes that use it stay together while the rest spread out
+fakefs_group = pytest.mark.xdist_group("fakefs")
+
+
+@pytest.fixture
+def fs_root(fs):
+    """Root for FileSystemStateStore tests on pyfakefs' in-memory filesystem."""
+    return Path("/fs_stores")
 
-        assert "repo.root" in state._persistent
-        stored = state._persistent["repo.root"]
-        assert isinstance(stored, Fact)
-        assert stored.value == "/path"
+
+@pytest.fixture
+def unique_agent(request):
+    """An agent_id unique to the requesting test, isolating it within fs_root."""
+    return "agent_" + re.sub(r"\W+", "_", request.node.nodeid.split("::", 1)[1])
 
 
 # ----------------------------------------------------------------------------
-# Issue 2b: apply_facts() correctly stores Fact objects by scope
+# Issue 1: IterationState.__init__ stores Fact objects, not dicts
 # ----------------------------------------------------------------------------
 
 
-class TestIterationStateApplyFacts:
-    def test_apply_iteration_scoped_fact(self):
-        """Iteration-scoped facts go to _iteration dict."""
-        state = IterationState(Facts())
-        facts = Facts(
-            temp=Fact(key="temp", value="ephemeral", scope="iteration"),
-        )
-
-        state.apply_facts(facts)
+class TestIterationStateInit:
+    @pytest.mark.parametrize(
+        "base, expected",
+        [
+            pytest.param(
+                Facts(foo=Fact(key="foo", value="bar", scope="persistent")),
+                {"foo": ("bar", "persistent")},
+                id="persistent",
+            ),
+            pytest.param(
+                Facts(
+                    durable=Fact(key="durable", value=1, scope="session"),
+                    ephemeral=Fact(key="ephemeral", value=2, scope="iteration"),
+                ),
+                {"durable": (1, "session")},
+                id="excludes_iteration_scoped",
+            ),
+            pytest.param(
+                Facts(repo=Facts(root=Fact(key="root", value="/path", scope="session"))),
+                {"repo.root": ("/path", "session")},
+                id="nested_dot_notation",
+            ),
+        ],
+    )
+    def test_persistent_holds_flattened_durable_facts(self, base, expected):
+        """_persistent holds durable Fact objects (not dicts) under flat keys."""
+        state = IterationState(base)
 
-        assert "temp" in state._iteration
-        stored = state._iteration["temp"]
-        assert isinstance(stored, Fact)
-        assert stored.scope == "iteration"
+        assert state.persistent_keys() == expected.keys()
+        for fq_key, (value, scope) in expected.items():
+            stored = state._persistent[fq_key]
+            assert isinstance(stored, Fact), f"Expected Fact, got {type(stored)}"
+            assert stored.key == fq_key.rsplit(".", 1)[-1]
+            assert stored.value == value
+            assert stored.scope == scope
 
-    def test_apply_persistent_scoped_fact(self):
-        """Persistent-scoped facts go to _persistent dict."""
-        state = IterationState(Facts())
-        facts = Facts(
-            perm=Fact(key="perm", value="durable", scope="persistent"),
-        )
 
-        state.apply_facts(facts)
+# ----------------------------------------------------------------------------
+# Issue 2b: apply_facts() correctly stores Fact objects by scope
+# ----------------------------------------------------------------------------
 
-        assert "perm" in state._persistent
-        stored = state._persistent["perm"]
-        assert isinstance(stored, Fact)
-        assert stored.scope == "persistent"
 
-    def test_apply_session_scoped_fact(self):
-        """Session-scoped facts go to _persistent dict."""
+class TestIterationStateApplyFacts:
+    @pytest.mark.parametrize(
+        "scope, bucket",
+        [
+            ("iteration", "_iteration"),
+            ("persistent", "_persistent"),
+            ("session", "_persistent"),
+        ],
+    )
+    def test_apply_routes_fact_by_scope(self, scope, bucket):
+        """Iteration-scoped facts go to _iteration; durable ones to _persistent."""
         state = IterationState(Facts())
-        facts = Facts(
-            sess=Fact(key="sess", value="session-data", scope="session"),
-        )
+        facts = Facts(k=Fact(key="k", value="v", scope=scope))
 
         state.apply_facts(facts)
 
-        assert "sess" in state._persistent
-        stored = state._persistent["sess"]
+        stored = getattr(state, bucket)["k"]
         assert isinstance(stored, Fact)
-        assert stored.scope == "session"
+        assert stored.scope == scope
 
     def test_fact_scope_attribute_accessible(self):
         """Stored facts must have accessible .scope attribute (not dicts)."""
@@ -127,6 +153,22 @@ class TestIterationStateApplyFacts:
         assert state._iteration["a"].scope == "iteration"
         assert state._persistent["b"].scope == "persistent"
 
+    def test_read_projection_prefers_iteration_facts(self):
+        """[] and get() read iteration facts first, then persistent facts."""
+        state = IterationState(Facts(k=Fact(key="k", value="durable", scope="session")))
+        state.apply_facts(Facts(k=Fact(key="k", value="fresh", scope="iteration")))
+
+        assert state["k"] == "fresh"
+        assert state.get("k") == "fresh"
+
+        state.begin_iteration()
+
+        assert state["k"] == "durable"
+        assert state.get("missing") is None
+        assert state.get("missing", "fallback") == "fallback"
+        with pytest.raises(KeyError):
+            state["missing"]
+
 
 # ----------------------------------------------------------------------------
 # Issue 2 & 4: InMemoryStateStore.save() signature and behavior
@@ -134,16 +176,12 @@ class TestIterationStateApplyFacts:
 
 
 class TestInMemoryStateStoreSave:
-    def test_save_stores_persistent_facts(self):
+    def test_save_stores_persistent_facts(self, make_iter_facts):
         """save() should store the provided persistent_facts."""
         store = InMemoryStateStore()
         store._persistent["agent1"] = Facts()
 
-        iteration_facts = IterationFacts(
-            iteration=1,
-            phase=Phase.READY_TO_CONTINUE,
-            by_action={},
-        )
+        iteration_facts = make_iter_facts()
         persistent_facts = Facts(
             keep=Fact(key="keep", value="durable", scope="persistent"),
         )
@@ -154,16 +192,12 @@ class TestInMemoryStateStoreSave:
         assert "keep" in result
         assert result["keep"].value == "durable"
 
-    def test_save_stores_facts_with_correct_types(self):
+    def test_save_stores_facts_with_correct_types(self, make_iter_facts):
         """save() stores Fact objects that are retrievable with correct types."""
         store = InMemoryStateStore()
         store._persistent["agent1"] = Facts()
 
-        iteration_facts = IterationFacts(
-            iteration=1,
-            phase=Phase.READY_TO_CONTINUE,
-            by_action={},
-        )
+        iteration_facts = make_iter_facts()
         persistent_facts = Facts(
             data=KnowledgeFact(key="data", value={"nested": "dict"}, scope="session"),
         )
@@ -200,7 +234,7 @@ class TestInMemoryStateStoreSave:
         assert history[0].iteration == 1
         assert "ActionA" in history[0].by_action
 
-    def test_save_signature_matches_protocol(self):
+    def test_save_signature_matches_protocol(self, make_iter_facts):
         """save() must accept (agent_id, iteration_facts, persistent_facts)."""
         store = InMemoryStateStore()
         store._persistent["agent1"] = Facts()
@@ -208,7 +242,7 @@ class TestInMemoryStateStoreSave:
         # This call pattern must work (matches StateStore protocol)
         store.save(
             agent_id="agent1",
-            iteration_facts=IterationFacts(iteration=1, phase=Phase.READY_TO_CONTINUE, by_action={}),
+            iteration_facts=make_iter_facts(),
             persistent_facts=Facts(),
         )
 
@@ -218,39 +252,36 @@ class TestInMemoryStateStoreSave:
 # ----------------------------------------------------------------------------
 
 
+@fakefs_group
 class TestFileSystemStateStoreSave:
-    def test_save_signature_matches_protocol(self, tmp_path):
+    def test_save_signature_matches_protocol(self, fs_root, unique_agent, make_iter_facts):
         """save() must accept (agent_id, iteration_facts, persistent_facts)."""
-        from slater.state import FileSystemStateStore
-
-        store = FileSystemStateStore(root=tmp_path)
+        store = FileSystemStateStore(root=fs_root)
 
         # This call pattern must work (matches StateStore protocol)
         store.save(
-            agent_id="agent1",
-            iteration_facts=IterationFacts(iteration=1, phase=Phase.READY_TO_CONTINUE, by_action={}),
+            agent_id=unique_agent,
+            iteration_facts=make_iter_facts(),
             persistent_facts=Facts(
                 goal=Fact(key="goal", value="test", scope="session"),
             ),
         )
 
-    def test_save_persists_facts_to_disk(self, tmp_path):
+    def test_save_persists_facts_to_disk(self, fs_root, unique_agent, make_iter_facts):
         """save() should write persistent_facts to JSON file."""
-        from slater.state import FileSystemStateStore
-
-        store = FileSystemStateStore(root=tmp_path)
+        store = FileSystemStateStore(root=fs_root)
         persistent_facts = Facts(
             goal=KnowledgeFact(key="goal", value="test goal", scope="session"),
         )
 
         store.save(
-            agent_id="agent1",
-            iteration_facts=IterationFacts(iteration=1, phase=Phase.READY_TO_CONTINUE, by_action={}),
+            agent_id=unique_agent,
+            iteration_facts=make_iter_facts(),
             persistent_facts=persistent_facts,
         )
 
         # Verify file exists and can be loaded
-        result = store.load("agent1")
+        result = store.load(unique_agent)
         assert "goal" in result
         assert result["goal"].value == "test goal"
 
@@ -260,12 +291,11 @@ class TestFileSystemStateStoreSave:
 # ----------------------------------------------------------------------------
 
 
+@fakefs_group
 class TestFileSystemStateStoreHistory:
-    def test_save_creates_history_file(self, tmp_path):
+    def test_save_creates_history_file(self, fs_root, unique_agent):
         """save() should create/append to {agent_id}_history.jsonl."""
-        from slater.state import FileSystemStateStore
-
-        store = FileSystemStateStore(root=tmp_path)
+        store = FileSystemStateStore(root=fs_root)
 
         iteration_facts = IterationFacts(
             iteration=1,
@@ -278,7 +308,7 @@ class TestFileSystemStateStoreHistory:
         )
 
         store.save(
-            agent_id="agent1",
+            agent_id=unique_agent,
             iteration_facts=iteration_facts,
             persistent_facts=Facts(
                 result=Fact(key="result", value="done", scope="persistent"),
@@ -286,14 +316,12 @@ class TestFileSystemStateStoreHistory:
         )
 
         # History file should exist
-        history_path = tmp_path / "agent1_history.jsonl"
+        history_path = fs_root / f"{unique_agent}_history.jsonl"
         assert history_path.exists()
 
-    def test_history_contains_iteration_data(self, tmp_path):
+    def test_history_contains_iteration_data(self, fs_root, unique_agent):
         """history() returns IterationFacts with expected fields."""
-        from slater.state import FileSystemStateStore
-
-        store = FileSystemStateStore(root=tmp_path)
+        store = FileSystemStateStore(root=fs_root)
 
         iteration_facts = IterationFacts(
             iteration=1,
@@ -306,12 +334,12 @@ class TestFileSystemStateStoreHistory:
         )
 
         store.save(
-            agent_id="agent1",
+            agent_id=unique_agent,
             iteration_facts=iteration_facts,
             persistent_facts=Facts(),
         )
 
-        history = store.history("agent1")
+        history = store.history(unique_agent)
 
         assert len(history) == 1
         record = history[0]
@@ -320,60 +348,49 @@ class TestFileSystemStateStoreHistory:
         assert record.timestamp is not None
         assert "ActionA" in record.by_action
 
-    def test_history_appends_multiple_iterations(self, tmp_path):
+    @pytest.mark.parametrize("n_iters", [2, 10, 100])
+    def test_history_appends_multiple_iterations(
+        self, n_iters, fs_root, unique_agent, make_iter_facts
+    ):
         """save() appends to history, preserving all iterations."""
-        from slater.state import FileSystemStateStore
+        store = FileSystemStateStore(root=fs_root)
+        history_path = fs_root / f"{unique_agent}_history.jsonl"
+        phases = [Phase.READY_TO_CONTINUE, Phase.TASK_COMPLETE]
 
-        store = FileSystemStateStore(root=tmp_path)
-
-        # Iteration 1
-        store.save(
-            agent_id="agent1",
-            iteration_facts=IterationFacts(
-                iteration=1,
-                phase=Phase.READY_TO_CONTINUE,
-                by_action={},
-            ),
-            persistent_facts=Facts(),
-        )
+        written = ""
+        for i in range(1, n_iters + 1):
+            store.save(
+                agent_id=unique_agent,
+                iteration_facts=make_iter_facts(iteration=i, phase=phases[i % 2 == 0]),
+                persistent_facts=Facts(),
+            )
 
-        # Iteration 2
-        store.save(
-            agent_id="agent1",
-            iteration_facts=IterationFacts(
-                iteration=2,
-                phase=Phase.TASK_COMPLETE,
-                by_action={},
-            ),
-            persistent_facts=Facts(),
-        )
+            # append-only: earlier records are never rewritten
+            content = history_path.read_text()
+            assert content.startswith(written)
+            written = content
 
-        history = store.history("agent1")
+        history = store.history(unique_agent)
 
-        assert len(history) == 2
-        assert history[0].iteration == 1
+        assert len(history) == n_iters
+        assert [h.iteration for h in history] == list(range(1, n_iters + 1))
         assert history[0].phase == "READY_TO_CONTINUE"
-        assert history[1].iteration == 2
         assert history[1].phase == "TASK_COMPLETE"
 
-    def test_history_empty_for_new_agent(self, tmp_path):
+    def test_history_empty_for_new_agent(self, fs_root, unique_agent):
         """history() returns empty list for agent with no history."""
-        from slater.state import FileSystemStateStore
-
-        store = FileSystemStateStore(root=tmp_path)
+        store = FileSystemStateStore(root=fs_root)
 
-        history = store.history("nonexistent")
+        history = store.history(unique_agent)
 
         assert history == []
 
-    def test_history_facts_are_deserialized(self, tmp_path):
+    def test_history_facts_are_deserialized(self, fs_root, unique_agent):
         """by_action contains deserialized Facts objects."""
-        from slater.state import FileSystemStateStore
-
-        store = FileSystemStateStore(root=tmp_path)
+        store = FileSystemStateStore(root=fs_root)
 
         store.save(
-            agent_id="agent1",
+            agent_id=unique_agent,
             iteration_facts=IterationFacts(
                 iteration=1,
                 phase=Phase.READY_TO_CONTINUE,
@@ -386,7 +403,7 @@ class TestFileSystemStateStoreHistory:
             persistent_facts=Facts(),
         )
 
-        history = store.history("agent1")
+        history = store.history(unique_agent)
         facts = history[0].by_action["ActionA"]
         data_fact = facts["data"]
 
@@ -402,55 +419,52 @@ class TestFileSystemStateStoreHistory:
 # ----------------------------------------------------------------------------
 
 
+@fakefs_group
 class TestStateStoreInterchangeability:
     """Both InMemoryStateStore and FileSystemStateStore must be drop-in replacements."""
 
-    def test_both_stores_accept_same_save_signature(self, tmp_path):
+    def test_both_stores_accept_same_save_signature(self, fs_root, unique_agent, make_iter_facts):
         """Both implementations accept identical save() arguments."""
-        from slater.state import FileSystemStateStore
-
         stores = [
             InMemoryStateStore(),
-            FileSystemStateStore(root=tmp_path),
+            FileSystemStateStore(root=fs_root),
         ]
 
         for store in stores:
             # Initialize
             if isinstance(store, InMemoryStateStore):
-                store._persistent["agent1"] = Facts()
+                store._persistent[unique_agent] = Facts()
 
             # Same call must work for both
             store.save(
-                agent_id="agent1",
-                iteration_facts=IterationFacts(iteration=1, phase=Phase.READY_TO_CONTINUE, by_action={}),
+                agent_id=unique_agent,
+                iteration_facts=make_iter_facts(),
                 persistent_facts=Facts(
                     data=Fact(key="data", value="value", scope="persistent"),
                 ),
             )
 
             # Both must return Facts with same structure
-            result = store.load("agent1")
+            result = store.load(unique_agent)
             assert "data" in result
             assert isinstance(result["data"], Fact)
             assert result["data"].value == "value"
 
-    def test_both_stores_return_iteration_facts_from_history(self, tmp_path):
+    def test_both_stores_return_iteration_facts_from_history(self, fs_root, unique_agent):
         """Both implementations return list[IterationFacts] from history()."""
-        from slater.state import FileSystemStateStore
-
         stores = [
             InMemoryStateStore(),
-            FileSystemStateStore(root=tmp_path / "fs"),
+            FileSystemStateStore(root=fs_root),
         ]
 
         for store in stores:
             # Initialize
             if isinstance(store, InMemoryStateStore):
-                store._persistent["agent1"] = Facts()
+                store._persistent[unique_agent] = Facts()
 
             # Save an iteration
             store.save(
-                agent_id="agent1",
+                agent_id=unique_agent,
                 iteration_facts=IterationFacts(
                     iteration=1,
                     phase=Phase.READY_TO_CONTINUE,
@@ -464,7 +478,7 @@ class TestStateStoreInterchangeability:
             )
 
             # Both must return list[IterationFacts]
-            history = store.history("agent1")
+            history = store.history(unique_agent)
             assert len(history) == 1
             record = history[0]
 
@@ -477,113 +491,94 @@ class TestStateStoreInterchangeability:
             assert "TestAction" in record.by_action
             assert isinstance(record.by_action["TestAction"], Facts)
 
+    def test_both_stores_iterate_history_lazily(self, fs_root, unique_agent, make_iter_facts):
+        """history_iter() yields the same records as history() for both stores."""
+        stores = [
+            InMemoryStateStore(),
+            FileSystemStateStore(root=fs_root),
+        ]
 
-# ----------------------------------------------------------------------------
-# Issue 5: Bootstrap handles partial config gracefully
-# ----------------------------------------------------------------------------
-
-
-class TestBootstrapNullSafety:
-    """Both StateStore implementations handle missing config fields."""
-
-    def test_inmemory_bootstrap_with_empty_config(self):
-        """InMemoryStateStore.bootstrap() handles empty config."""
-        from slater.config import BootstrapConfig
+        for store in stores:
+            assert list(store.history_iter(unique_agent)) == []
 
-        store = InMemoryStateStore()
-        config = BootstrapConfig()  # All fields None
+            for i in (1, 2):
+                store.save(
+                    agent_id=unique_agent,
+                    iteration_facts=make_iter_facts(iteration=i),
+                    persistent_facts=Facts(),
+                )
 
-        # Should not raise
-        store.bootstrap("agent1", config)
+            records = store.history_iter(unique_agent)
+            assert not isinstance(records, list)
+            assert [r.iteration for r in records] == [1, 2]
+            assert [r.iteration for r in store.history(unique_agent)] == [1, 2]
 
-        result = store.load("agent1")
-        assert isinstance(result, Facts)
 
-    def test_inmemory_bootstrap_with_goal_only(self):
-        """InMemoryStateStore.bootstrap() handles config with only goal."""
-        from slater.config import BootstrapConfig
+class TestFileSystemStateStoreOnDisk:
+    """Smoke test of the real file IO path (the rest of the module uses pyfakefs)."""
 
-        store = InMemoryStateStore()
-        config = BootstrapConfig(goal="test goal")
-
-        store.bootstrap("agent1", config)
+    def test_round_trip_on_real_filesystem(self, tmp_path, make_iter_facts):
+        store = FileSystemStateStore(root=tmp_path)
+        store.bootstrap("agent1", BootstrapConfig(goal="test goal"))
 
-        result = store.load("agent1")
-        assert "goal" in result
-        assert result["goal"].value == "test goal"
-        assert "repo_root" not in result
+        store.save(
+            agent_id="agent1",
+            iteration_facts=make_iter_facts(),
+            persistent_facts=Facts(
+                goal=KnowledgeFact(key="goal", value="test goal", scope="session"),
+            ),
+        )
 
-    def test_filesystem_bootstrap_with_empty_config(self, tmp_path):
-        """FileSystemStateStore.bootstrap() handles empty config."""
-        from slater.config import BootstrapConfig
-        from slater.state import FileSystemStateStore
+        assert (tmp_path / "agent1.json").is_file()
+        assert not (tmp_path / "agent1.tmp").exists()
+        assert FileSystemStateStore(root=tmp_path).load("agent1")["goal"].value == "test goal"
+        assert [h.iteration for h in store.history("agent1")] == [1]
 
+    def test_history_iter_closes_file_before_yielding(self, tmp_path, make_iter_facts):
+        """An abandoned history_iter() holds no open handle on the history file."""
         store = FileSystemStateStore(root=tmp_path)
-        config = BootstrapConfig()  # All fields None
-
-        # Should not raise
-        store.bootstrap("agent1", config)
+        for i in (1, 2):
+            store.save(agent_id="agent1", iteration_facts=make_iter_facts(iteration=i), persistent_facts=Facts())
 
-        result = store.load("agent1")
-        assert isinstance(result, Facts)
+        records = store.history_iter("agent1")
 
-    def test_filesystem_bootstrap_with_goal_only(self, tmp_path):
-        """FileSystemStateStore.bootstrap() handles config with only goal."""
-        from slater.config import BootstrapConfig
-        from slater.state import FileSystemStateStore
+        assert next(records).iteration == 1
+        assert records.gi_frame.f_locals["f"].closed
 
-        store = FileSystemStateStore(root=tmp_path)
-        config = BootstrapConfig(goal="test goal")
 
-        store.bootstrap("agent1", config)
+# ----------------------------------------------------------------------------
+# Issue 5: Bootstrap handles partial config gracefully
+# ----------------------------------------------------------------------------
 
-        result = store.load("agent1")
-        assert "goal" in result
-        assert result["goal"].value == "test goal"
-        assert "repo_root" not in result
 
-    def test_filesystem_bootstrap_with_repo_no_ignore(self, tmp_path):
-        """FileSystemStateStore.bootstrap() handles repo config without ignore."""
-        from slater.config import BootstrapConfig, RepoConfig
-        from slater.state import FileSystemStateStore
+@fakefs_group
+class TestBootstrapNullSafety:
+    """Both StateStore implementations handle missing config fields."""
 
-        store = FileSystemStateStore(root=tmp_path)
-        config = BootstrapConfig(
-            repo=RepoConfig(root="/path/to/repo")
-        )
+    @pytest.mark.parametrize("config, expected", BOOTSTRAP_CASES)
+    @pytest.mark.parametrize("store_factory", STORE_FACTORIES, ids=STORE_IDS)
+    def test_bootstrap_seeds_only_configured_facts(
+        self, store_factory, config, expected, fs_root, unique_agent
+    ):
+        """bootstrap() seeds a Fact per configured field and nothing for missing ones."""
+        store = store_factory(fs_root)
 
-        store.bootstrap("agent1", config)
+        store.bootstrap(unique_agent, config)
 
-        result = store.load("agent1")
-        assert "repo_root" in result
-        assert result["repo_root"].value == "/path/to/repo"
-        assert "repo_ignore" not in result
+        result = store.load(unique_agent)
+        assert isinstance(result, Facts)
+        assert {k: f.value for k, f in result.flatten().items()} == expected
 
-    def test_both_stores_bootstrap_identically(self, tmp_path):
+    @pytest.mark.parametrize("config, expected", BOOTSTRAP_CASES)
+    def test_both_stores_bootstrap_identically(self, config, expected, fs_root, unique_agent):
         """Both implementations produce same Facts for same config."""
-        from slater.config import BootstrapConfig, RepoConfig
-        from slater.state import FileSystemStateStore
-
-        config = BootstrapConfig(
-            goal="test goal",
-            repo=RepoConfig(root="/path", ignore=["*.pyc"]),
-        )
-
         inmemory = InMemoryStateStore()
-        inmemory.bootstrap("agent1", config)
-        inmemory_result = inmemory.load("agent1")
-
-        filesystem = FileSystemStateStore(root=tmp_path)
-        filesystem.bootstrap("agent1", config)
-        filesystem_result = filesystem.load("agent1")
+        inmemory.bootstrap(unique_agent, config)
 
-        # Same keys
-        assert set(inmemory_result.flatten().keys()) == set(filesystem_result.flatten().keys())
+        filesystem = FileSystemStateStore(root=fs_root)
+        filesystem.bootstrap(unique_agent, config)
 
-        # Same values
-        assert inmemory_result["goal"].value == filesystem_result["goal"].value
-        assert inmemory_result["repo_root"].value == filesystem_result["repo_root"].value
-        assert inmemory_result["repo_ignore"].value == filesystem_result["repo_ignore"].value
+        assert inmemory.load(unique_agent).serialize() == filesystem.load(unique_agent).serialize()
 
 
 # ----------------------------------------------------------------------------
@@ -591,56 +586,52 @@ class TestBootstrapNullSafety:
 # ----------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="class")
+def single_rule_policy():
+    return TransitionPolicy(
+        rules=[
+            PhaseRule(
+                enter=Phase.READY_TO_CONTINUE,
+                when_all=frozenset({"goal", "repo_root"}),
+            ),
+        ],
+        default=Phase.READY_TO_CONTINUE,
+    )
+
+
+@pytest.fixture(scope="class")
+def nondet_policy():
+    return TransitionPolicy(
+        rules=[
+            PhaseRule(enter=Phase.READY_TO_CONTINUE, when_all=frozenset({"a"})),
+            PhaseRule(enter=Phase.TASK_COMPLETE, when_all=frozenset({"a"})),
+        ],
+        default=Phase.READY_TO_CONTINUE,
+    )
+
+
 class TestTransitionPolicyDerivePhase:
-    def test_derive_phase_accepts_set_of_strings(self):
+    def test_derive_phase_accepts_set_of_strings(self, single_rule_policy):
         """derive_phase() must accept AbstractSet[str], not Facts."""
-        policy = TransitionPolicy(
-            rules=[
-                PhaseRule(
-                    enter=Phase.READY_TO_CONTINUE,
-                    when_all=frozenset({"goal", "repo_root"}),
-                ),
-            ],
-            default=Phase.READY_TO_CONTINUE,
-        )
-
         # Pass a set of keys (correct usage after fix)
         keys = {"goal", "repo_root", "extra_key"}
-        result = policy.derive_phase(keys)
+        result = single_rule_policy.derive_phase(keys)
 
         assert result == Phase.READY_TO_CONTINUE
 
-    def test_derive_phase_returns_none_when_no_match(self):
+    def test_derive_phase_returns_none_when_no_match(self, single_rule_policy):
         """derive_phase() returns None when no rules match."""
-        policy = TransitionPolicy(
-            rules=[
-                PhaseRule(
-                    enter=Phase.READY_TO_CONTINUE,
-                    when_all=frozenset({"required_key"}),
-                ),
-            ],
-            default=Phase.READY_TO_CONTINUE,
-        )
-
         keys = {"other_key"}
-        result = policy.derive_phase(keys)
+        result = single_rule_policy.derive_phase(keys)
 
         assert result is None
 
-    def test_derive_phase_raises_on_non_determinism(self):
+    def test_derive_phase_raises_on_non_determinism(self, nondet_policy):
         """derive_phase() raises when multiple rules match."""
-        policy = TransitionPolicy(
-            rules=[
-                PhaseRule(enter=Phase.READY_TO_CONTINUE, when_all=frozenset({"a"})),
-                PhaseRule(enter=Phase.TASK_COMPLETE, when_all=frozenset({"a"})),
-            ],
-            default=Phase.READY_TO_CONTINUE,
-        )
-
         keys = {"a", "b"}
 
         with pytest.raises(ValueError, match="Non-deterministic"):
-            policy.derive_phase(keys)
+            nondet_policy.derive_phase(keys)
 
 
 # ----------------------------------------------------------------------------
@@ -671,73 +662,43 @@ class TestFactsRoundTrip:
         assert recovered["goal"].value == "test goal"
         assert recovered["repo_root"].value == "/path/to/repo"
 
+    def test_persistent_keys_match_serialized_persistent_facts(self):
+        """persistent_keys() equals the keys of persistent_facts().serialize()."""
+        state = IterationState(Facts(
+            goal=KnowledgeFact(key="goal", value="test goal", scope="session"),
+            repo=Facts(root=KnowledgeFact(key="root", value="/path", scope="session")),
+        ))
+        state.apply_facts(Facts(
+            temp=Fact(key="temp", value=1, scope="iteration"),
+            done=Fact(key="done", value=True, scope="persistent"),
+        ))
 
-# ----------------------------------------------------------------------------
-# Issue 7: Cycle detection in AgentController
-# ----------------------------------------------------------------------------
-
-
-class TestCycleDetection:
-    """Tests for AgentController._detect_cycle()."""
-
-    def test_detect_cycle_returns_false_when_history_too_short(self):
-        """No cycle if history shorter than max_same_phase."""
-        from slater.controller import AgentController
-
-        # Create minimal controller to access _detect_cycle
-        # We'll test the method directly
-        history = [Phase.READY_TO_CONTINUE, Phase.READY_TO_CONTINUE]
-        max_same_phase = 3
-
-        # Use the function directly (it's a static-like method)
-        result = AgentController._detect_cycle(None, history, max_same_phase)
-
-        assert result is False
-
-    def test_detect_cycle_returns_true_when_stuck(self):
-        """Cycle detected when same phase repeats max_same_phase times."""
-        from slater.controller import AgentController
-
-        history = [
-            Phase.READY_TO_CONTINUE,
-            Phase.READY_TO_CONTINUE,
-            Phase.READY_TO_CONTINUE,
-        ]
-        max_same_phase = 3
-
-        result = AgentController._detect_cycle(None, history, max_same_phase)
-
-        assert result is True
+        keys = state.persistent_keys()
 
-    def test_detect_cycle_returns_false_when_phases_vary(self):
-        """No cycle when phases change."""
-        from slater.controller import AgentController
+        assert keys == set(state.persistent_facts().serialize())
+        assert keys == {"goal", "repo.root", "done"}
 
-        history = [
-            Phase.READY_TO_CONTINUE,
-            Phase.TASK_COMPLETE,
-            Phase.READY_TO_CONTINUE,
-        ]
-        max_same_phase = 3
 
-        result = AgentController._detect_cycle(None, history, max_same_phase)
+# ----------------------------------------------------------------------------
+# Issue 7: Cycle detection in AgentController
+# ----------------------------------------------------------------------------
 
-        assert result is False
 
-    def test_detect_cycle_checks_only_recent_history(self):
-        """Cycle detection only looks at most recent entries."""
-        from slater.controller import AgentController
+R, T = Phase.READY_TO_CONTINUE, Phase.TASK_COMPLETE
 
-        history = [
-            Phase.READY_TO_CONTINUE,
-            Phase.READY_TO_CONTINUE,
-            Phase.READY_TO_CONTINUE,
-            Phase.TASK_COMPLETE,  # Changed!
-            Phase.TASK_COMPLETE,
-            Phase.TASK_COMPLETE,  # Now stuck in TASK_COMPLETE
-        ]
-        max_same_phase = 3
 
-        result = AgentController._detect_cycle(None, history, max_same_phase)
+class TestCycleDetection:
+    """Tests for AgentController._detect_cycle()."""
 
-        assert result is True  # Stuck in TASK_COMPLETE
+    @pytest.mark.parametrize(
+        "history, expected",
+        [
+            pytest.param([R, R], False, id="history_too_short"),
+            pytest.param([R, R, R], True, id="stuck"),
+            pytest.param([R, T, R], False, id="phases_vary"),
+            pytest.param([R, R, R, T, T, T], True, id="only_recent_history"),
+        ],
+    )
+    def test_detect_cycle(self, history, expected):
+        """A cycle is the last max_same_phase entries all being the same phase."""
+        assert AgentController._detect_cycle(history, max_same_phase=3) is expected
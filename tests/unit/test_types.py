@@ -1,6 +1,41 @@
+import json
+import sys
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
+
 import pytest
+from hypothesis import given, settings, strategies as st
+
+import slater.types
+from slater.types import Fact, Facts, FactType, IterationFacts, KnowledgeFact, StateFragment
+
+
+# ----------------------------------------------------------------------------
+# Strategies
+# ----------------------------------------------------------------------------
+
 
-from slater.types import Fact, Facts, IterationFacts, KnowledgeFact
+def _build_facts(tree: dict) -> Facts:
+    """Build Facts from {key: (value, scope) | subtree}, aligning leaf keys."""
+    return Facts(**{
+        key: _build_facts(node) if isinstance(node, dict) else Fact(key=key, value=node[0], scope=node[1])
+        for key, node in tree.items()
+    })
+
+
+# keys are dot-free (dots are the flattening separator); groups are never
+# empty (an empty group has no leaves, so it cannot survive flattening)
+_keys = st.text(alphabet=st.characters(blacklist_characters="."), min_size=1, max_size=8)
+_leaves = st.tuples(
+    st.one_of(st.none(), st.booleans(), st.integers(), st.text(), st.lists(st.text(), max_size=3)),
+    st.sampled_from(["iteration", "session", "persistent"]),
+)
+facts_trees = st.recursive(
+    st.dictionaries(_keys, _leaves, min_size=1, max_size=4),
+    lambda children: st.dictionaries(_keys, st.one_of(_leaves, children), min_size=1, max_size=4),
+    max_leaves=12,
+).map(_build_facts)
 
 
 # ----------------------------------------------------------------------------
@@ -40,6 +75,65 @@ class TestFactsStructureTransformation:
         assert isinstance(flat["repo.root"], Fact)
         assert flat["repo.root"].value == "/path"
 
+    def test_flatten_deep_wide_tree(self):
+        """flatten() matches a recursive walk, in order, on a deep and wide tree."""
+        def tree(depth: int) -> Facts:
+            if depth == 0:
+                return Facts(**{f"f{i}": Fact(key=f"f{i}", value=i) for i in range(4)})
+            # mix leaves and groups at every level
+            return Facts(
+                first=Fact(key="first", value=depth),
+                **{f"n{i}": tree(depth - 1) for i in range(4)},
+                last=Fact(key="last", value=-depth),
+            )
+
+        def walk(prefix: str, node: Facts):
+            for key, item in node.items():
+                fq = f"{prefix}.{key}" if prefix else key
+                if isinstance(item, Facts):
+                    yield from walk(fq, item)
+                else:
+                    yield fq, item
+
+        facts = tree(5)
+
+        assert list(facts.flatten().items()) == list(walk("", facts))
+        assert len(facts.flatten()) == 4**6 + 2 * sum(4**d for d in range(5))
+
+    def test_flatten_descends_into_facts_subclasses(self):
+        """Groups that subclass Facts are walked like Facts, not treated as leaves."""
+        class RepoFacts(Facts):
+            pass
+
+        root = Fact(key="root", value="/path", scope="session")
+        facts = Facts(repo=RepoFacts(root=root))
+
+        assert facts.flatten() == {"repo.root": root}
+        assert list(facts.iter_facts()) == [("repo.root", root)]
+        assert facts.serialize() == {"repo.root": root.serialize()}
+
+    def test_flatten_handles_very_deep_trees(self):
+        """flatten() walks iteratively, so nesting depth is not bounded by recursion."""
+        leaf = Fact(key="leaf", value=1)
+        facts = Facts(leaf=leaf)
+        for _ in range(1500):
+            facts = Facts(n=facts)
+
+        assert facts.flatten() == {"n." * 1500 + "leaf": leaf}
+
+    def test_iter_facts_is_lazy(self):
+        """iter_facts() streams (key, Fact) pairs without building the flat dict."""
+        facts = Facts(
+            goal=Fact(key="goal", value="test", scope="session"),
+            repo=Facts(root=Fact(key="root", value="/path", scope="session")),
+        )
+
+        it = facts.iter_facts()
+
+        assert iter(it) is it
+        assert next(it) == ("goal", facts["goal"])
+        assert [("goal", facts["goal"]), *it] == list(facts.flatten().items())
+
     def test_unflatten_simple(self):
         """unflatten() reconstructs nested Facts from flat Dict[str, Fact]."""
         flat = {
@@ -68,6 +162,41 @@ class TestFactsStructureTransformation:
         assert "root" in facts["repo"]
         assert facts["repo"]["root"].value == "/path"
 
+    def test_unflatten_tuples_simple(self):
+        """unflatten_tuples() accepts single-segment paths."""
+        flat = {
+            ("goal",): Fact(key="goal", value="test", scope="session"),
+            ("status",): Fact(key="status", value="ready", scope="persistent"),
+        }
+
+        facts = Facts.unflatten_tuples(flat)
+
+        assert isinstance(facts["goal"], Fact)
+        assert facts["goal"].value == "test"
+        assert facts["status"].value == "ready"
+
+    def test_unflatten_tuples_nested(self):
+        """unflatten_tuples() builds the same tree as unflatten() from pre-split paths."""
+        root = Fact(key="root", value="/path", scope="session")
+        ignore = Fact(key="ignore", value=["*.pyc"], scope="session")
+
+        facts = Facts.unflatten_tuples({("repo", "root"): root, ("repo", "ignore"): ignore})
+
+        assert isinstance(facts["repo"], Facts)
+        assert facts["repo"]["root"].value == "/path"
+        assert facts == Facts.unflatten({"repo.root": root, "repo.ignore": ignore})
+
+    def test_unflatten_shares_interned_segments(self):
+        """Path segments are interned, so trees rebuilt from the same keys share them."""
+        flat = {"repo.root": Fact(key="root", value="/path", scope="session")}
+
+        first = Facts.unflatten(flat)
+        second = Facts.deserialize(Facts(repo=first["repo"]).serialize())
+
+        (first_key,) = first
+        (second_key,) = second
+        assert first_key is second_key is sys.intern("repo")
+
     def test_flatten_unflatten_roundtrip(self):
         """flatten() and unflatten() are inverses."""
         original = Facts(
@@ -90,6 +219,16 @@ class TestFactsStructureTransformation:
 # ----------------------------------------------------------------------------
 
 
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """Run dump_json/load_json with orjson (when installed) and with the stdlib fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(slater.types, "orjson", None)
+    return request.param
+
+
 class TestFactsFullTransformation:
     """Tests for serialize/deserialize (structure + type, JSON-safe)."""
 
@@ -119,6 +258,64 @@ class TestFactsFullTransformation:
         assert "repo.root" in serialized
         assert serialized["repo.root"]["value"] == "/path"
 
+    def test_serialize_rejects_non_json_value_naming_the_fact(self):
+        """serialize() raises TypeError naming the nested Fact that can't be encoded."""
+        facts = Facts(
+            repo=Facts(
+                root=Fact(key="root", value="/path", scope="session"),
+                handle=Fact(key="handle", value=object(), scope="session"),
+            ),
+        )
+
+        with pytest.raises(TypeError, match="Fact 'handle' has non-JSON-serializable value"):
+            facts.serialize()
+
+    def test_dump_json_load_json_roundtrip(self, json_backend):
+        """dump_json() encodes serialize() as bytes; load_json() inverts it, with or without orjson."""
+        facts = Facts(
+            goal=Fact(key="goal", value="test", scope="session"),
+            repo=Facts(ignore=Fact(key="ignore", value=["*.pyc"], scope="session")),
+        )
+
+        payload = facts.dump_json()
+
+        assert isinstance(payload, bytes)
+        assert json.loads(payload) == facts.serialize()
+        assert Facts.load_json(payload) == facts
+
+    @pytest.mark.parametrize(
+        "value",
+        [float("nan"), float("inf"), 2**70, -(2**70), -(2**63) - 1, [-(2**63) - 1], {1: "a"}, (1, 2), "\ud800"],
+        ids=[
+            "nan", "inf", "big-int", "big-negative-int", "below-i64-min", "below-i64-min-in-list",
+            "int-key", "tuple", "lone-surrogate",
+        ],
+    )
+    def test_dump_json_load_json_match_stdlib_json(self, json_backend, value):
+        """Edge values JSON-encode and decode exactly as via serialize() + stdlib json."""
+        facts = Facts(edge=Fact(key="edge", value=value, scope="session"))
+        expected = Facts.deserialize(json.loads(json.dumps(facts.serialize())))
+
+        roundtrip = Facts.load_json(facts.dump_json())
+
+        # compared re-encoded, since nan != nan
+        assert json.dumps(roundtrip.serialize()) == json.dumps(expected.serialize())
+        assert type(roundtrip["edge"].value) is type(expected["edge"].value)
+
+    @pytest.mark.parametrize(
+        "value",
+        [object(), {1, 2}, b"bytes", datetime(2024, 1, 1), UUID(int=0), Enum("Color", "RED").RED],
+        ids=["object", "set", "bytes", "datetime", "uuid", "enum"],
+    )
+    def test_dump_json_rejects_non_json_value_naming_the_fact(self, json_backend, value):
+        """dump_json() raises the same TypeError as serialize() for values json rejects."""
+        facts = Facts(handle=Fact(key="handle", value=value, scope="session"))
+
+        with pytest.raises(TypeError, match="Fact 'handle' has non-JSON-serializable value"):
+            facts.serialize()
+        with pytest.raises(TypeError, match="Fact 'handle' has non-JSON-serializable value"):
+            facts.dump_json()
+
     def test_deserialize_from_json_dicts(self):
         """deserialize() reconstructs Facts from Dict[str, dict]."""
         serialized = {
@@ -176,6 +373,37 @@ class TestFactsFullTransformation:
         assert manual["goal"].value == via_deserialize["goal"].value
         assert manual["goal"].scope == via_deserialize["goal"].scope
 
+    def test_deserialize_matches_composition_on_large_input(self):
+        """The single-pass bulk path agrees with unflatten + Fact.deserialize at scale."""
+        scopes = ("iteration", "session", "persistent")
+        serialized = {
+            f"group{i % 50}.fact{i}": {"key": f"fact{i}", "value": i, "scope": scopes[i % 3]}
+            for i in range(5000)
+        }
+
+        manual = Facts.unflatten({k: Fact.deserialize(v) for k, v in serialized.items()})
+
+        assert Facts.deserialize(serialized) == manual
+
+
+# ----------------------------------------------------------------------------
+# Round-trip properties
+# ----------------------------------------------------------------------------
+
+
+class TestFactsRoundTripProperties:
+    """flatten/unflatten and serialize/deserialize are inverses for any tree."""
+
+    @settings(max_examples=50, deadline=None)
+    @given(facts_trees)
+    def test_flatten_unflatten_roundtrip(self, facts):
+        assert Facts.unflatten(facts.flatten()) == facts
+
+    @settings(max_examples=50, deadline=None)
+    @given(facts_trees)
+    def test_serialize_deserialize_roundtrip(self, facts):
+        assert Facts.deserialize(facts.serialize()) == facts
+
 
 # ----------------------------------------------------------------------------
 # Existing tests
@@ -193,6 +421,40 @@ def test_fact_key_mismatch_raises():
         assert False, "Expected ValueError was not raised"
 
 
+@pytest.mark.parametrize("fact_cls", [Fact, *(t.value for t in FactType)])
+def test_fact_is_slotted_and_hashable(fact_cls):
+    fact = fact_cls(key="k", value=1, scope="session")
+
+    assert not hasattr(fact, "__dict__")
+    assert hash(fact) == hash(fact_cls(key="k", value=1, scope="session"))
+
+
+def test_state_fragment_is_slotted():
+    fragment = StateFragment(data={"k": 1})
+
+    assert not hasattr(fragment, "__dict__")
+
+
+@pytest.mark.parametrize("value", ["s", 1, 1.5, True, None, [1, "a"], {"k": [None]}])
+def test_fact_serialize_accepts_json_values(value):
+    assert Fact(key="k", value=value).serialize() == {"key": "k", "value": value, "scope": "iteration"}
+
+
+@pytest.mark.parametrize("value", [object(), {1, 2}, [object()], b"bytes"])
+def test_fact_serialize_rejects_non_json_values(value):
+    with pytest.raises(TypeError, match="Fact 'k' has non-JSON-serializable value"):
+        Fact(key="k", value=value).serialize()
+
+
+def test_key_and_scope_are_interned():
+    # built at runtime so the strings start out as distinct objects
+    a = Fact(key="".join(["k", "ey"]), value=1, scope="".join(["sess", "ion"]))
+    b = Fact.deserialize(json.loads('{"key": "key", "value": 2, "scope": "session"}'))
+
+    assert a.key is b.key
+    assert a.scope is b.scope is sys.intern("session")
+
+
 def test_iteration_facts_dataclass():
     iteration_facts = IterationFacts(
         iteration=1,
@@ -210,3 +472,73 @@ def test_iteration_facts_dataclass():
     assert isinstance(iteration_facts.by_action, dict)
     assert iteration_facts.by_action["Action1"]["fact1"].value == 123
     assert iteration_facts.by_action["Action2"]["fact2"].value == "abc"
+
+
+def test_iteration_facts_serialize_all():
+    iteration_facts = IterationFacts(
+        iteration=1,
+        by_action={
+            "Scan": Facts(repo=Facts(root=Fact(key="root", value="/path"))),
+            "Plan": Facts(goal=Fact(key="goal", value="ship")),
+        },
+    )
+
+    flat = iteration_facts.serialize_all()
+
+    assert list(flat) == ["Scan.repo.root", "Plan.goal"]
+    assert flat == {
+        f"{action}.{fq_key}": serialized
+        for action, facts in iteration_facts.serialize()["by_action"].items()
+        for fq_key, serialized in facts.items()
+    }
+
+
+def test_iteration_facts_columnar_view():
+    iteration_facts = IterationFacts(
+        iteration=1,
+        by_action={
+            f"Action{a}": Facts(**{
+                f"fact{f}": Fact(key=f"fact{f}", value=a * 100 + f) for f in range(1, 5)
+            })
+            for a in range(1, 4)
+        },
+    )
+
+    columns = iteration_facts.to_columns()
+
+    assert set(columns) == {"fact1", "fact2", "fact3", "fact4"}
+    assert columns["fact1"]["Action1"].value == 101
+    assert [f.value for f in columns["fact2"].values()] == [102, 202, 302]
+
+    # the columnar view loses nothing: pivoting back restores by_action
+    rows: dict = {}
+    for key, by_action in columns.items():
+        for action, fact in by_action.items():
+            rows.setdefault(action, {})[key] = fact
+    assert {action: Facts.unflatten(flat) for action, flat in rows.items()} == iteration_facts.by_action
+
+
+def test_iteration_facts_columnar_view_tracks_mutation():
+    iteration_facts = IterationFacts(
+        iteration=1,
+        by_action={"A": Facts(x=Fact(key="x", value=1))},
+    )
+    iteration_facts.to_columns()
+
+    iteration_facts.by_action["A"]["y"] = Fact(key="y", value=2)
+
+    assert set(iteration_facts.to_columns()) == {"x", "y"}
+
+
+def test_iteration_facts_columns_share_keys_across_records():
+    def record(iteration: int) -> IterationFacts:
+        return IterationFacts(
+            iteration=iteration,
+            by_action={"Scan": Facts(repo=Facts(root=Fact(key="root", value=iteration)))},
+        )
+
+    (first,) = record(1).to_columns()
+    (second,) = record(2).to_columns()
+
+    assert first == "repo.root"
+    assert first is second
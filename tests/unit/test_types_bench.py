@@ -0,0 +1,50 @@
+"""
+Throughput checks for Facts serialization at scale.
+
+Skipped unless orjson is installed; the throughput benchmarks also need
+pytest-benchmark.
+"""
+
+from importlib.util import find_spec
+
+import pytest
+
+orjson = pytest.importorskip("orjson")
+
+from slater.types import Fact, Facts  # noqa: E402
+
+
+needs_benchmark = pytest.mark.skipif(
+    find_spec("pytest_benchmark") is None, reason="pytest-benchmark not installed"
+)
+
+
+@pytest.fixture(scope="module")
+def big_facts():
+    """10k leaf Facts spread over 100 groups."""
+    return Facts(**{
+        f"group{g}": Facts(**{
+            f"fact{i}": Fact(key=f"fact{i}", value=[g, i, f"v{i}"], scope="session")
+            for i in range(100)
+        })
+        for g in range(100)
+    })
+
+
+def test_serialize_orjson_roundtrip(big_facts):
+    """serialize() output is orjson-native and deserializes to an equal tree."""
+    payload = orjson.dumps(big_facts.serialize())
+
+    assert Facts.deserialize(orjson.loads(payload)) == big_facts
+
+
+@needs_benchmark
+def test_serialize_orjson_throughput(benchmark, big_facts):
+    benchmark(lambda: orjson.dumps(big_facts.serialize()))
+
+
+@needs_benchmark
+def test_deserialize_orjson_throughput(benchmark, big_facts):
+    payload = orjson.dumps(big_facts.serialize())
+
+    benchmark(lambda: Facts.deserialize(orjson.loads(payload)))